@@ -1,8 +1,18 @@
 import { NextResponse } from 'next/server';
-import { getAllNews } from '../../../lib/news/repository';
+import { getAllNews, getGroupedNewsSnapshot } from '../../../lib/news/repository';
 
-export async function GET() {
+export async function GET(request: Request) {
   try {
+    // Serve the precomputed snapshot when available (no database query)
+    const snapshot = await getGroupedNewsSnapshot();
+    if (snapshot) {
+      const headers: Record<string, string> = snapshot.etag ? { ETag: snapshot.etag } : {};
+      if (snapshot.etag && request.headers.get('if-none-match') === snapshot.etag) {
+        return new NextResponse(null, { status: 304, headers });
+      }
+      return NextResponse.json(snapshot.news, { headers });
+    }
+
     const news = await getAllNews();
 
     // Transform to match frontend expectations (grouped by category)
@@ -1,5 +1,5 @@
 import { CategoryPageClient } from "./CategoryPageClient";
-import { getAllNews } from "@/lib/news/repository";
+import { getNewsForCategory } from "@/lib/news/repository";
 import { getCategoryName } from "@/lib/utils/categories";
 import { Metadata } from "next";
 import { notFound } from "next/navigation";
@@ -48,11 +48,7 @@ export default async function CategoryPage({ params }: { params: Promise<{ categ
         notFound();
     }
 
-    // Fetch all articles and filter by category
-    const allArticles = await getAllNews();
-    const articles = allArticles.filter(article =>
-        article.category?.toLowerCase().trim() === categoryName.toLowerCase().trim()
-    );
+    const articles = await getNewsForCategory(categoryName);
 
     return <CategoryPageClient articles={articles} categoryName={categoryName} categorySlug={categorySlug} />;
 }
@@ -60,7 +60,7 @@ export function MobileNewsCard({ article }: { article: NewsArticle }) {
             <div
                 className="absolute inset-0"
                 style={{
-                    backgroundImage: `url(${article.imageUrl})`,
+                    backgroundImage: `url(${article.thumbnailUrl || article.imageUrl})`,
                     backgroundSize: "cover",
                     backgroundPosition: "center",
                     filter: "blur(12px)",
@@ -74,7 +74,7 @@ export function MobileNewsCard({ article }: { article: NewsArticle }) {
                 {/* Top section: original crisp image (occupies 1/4 of height) */}
                 <div className="h-1/4" style={{ touchAction: 'pan-x' }}>
                     <img
-                        src={article.imageUrl}
+                        src={article.thumbnailUrl || article.imageUrl}
                         alt={article.title}
                         className="object-cover w-full h-full"
                         style={{ touchAction: 'pan-x' }}
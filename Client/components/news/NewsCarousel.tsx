@@ -58,7 +58,7 @@ export function NewsCarousel({ articles }: NewsCarouselProps) {
               <div
                 className="absolute inset-0"
                 style={{
-                  backgroundImage: `url(${article.imageUrl})`,
+                  backgroundImage: `url(${article.thumbnailUrl || article.imageUrl})`,
                   backgroundSize: "cover",
                   backgroundPosition: "center",
                   filter: "blur(12px)",
@@ -72,7 +72,7 @@ export function NewsCarousel({ articles }: NewsCarouselProps) {
                 <div className="w-1/2 h-full overflow-hidden">
                   {article.imageUrl && (
                     <img
-                      src={article.imageUrl}
+                      src={article.thumbnailUrl || article.imageUrl}
                       alt={article.title}
                       className="w-full h-full object-cover"
                     />
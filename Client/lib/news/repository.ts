@@ -16,11 +16,77 @@ type DBArticle = {
   expired_at?: string | null;
   gone_at?: string | null;
   deleted_at?: string | null;
+  thumbnails?: Record<string, string> | null;
 };
 
 // Lifecycle: active (0-48h) → expired (48h-7d) → gone (7-30d) → deleted
 export type ArticleLifecycleState = 'active' | 'expired' | 'gone' | 'deleted';
 
+// Precomputed snapshots published by the ingestion pipeline (NewsData/storage/snapshots.py)
+const SNAPSHOT_BUCKET = 'snapshots';
+const SNAPSHOT_REVALIDATE_SECONDS = 60;
+
+type SnapshotArticle = Omit<NewsArticle, 'date'> & { date: string; expired_at?: string | null };
+type SnapshotSitemapEntry = { id: string; title: string; date: string; expired_at?: string | null };
+
+async function fetchSnapshot<T>(path: string): Promise<{ data: T; etag: string | null } | null> {
+  const { data } = supabase.storage.from(SNAPSHOT_BUCKET).getPublicUrl(path);
+
+  try {
+    const response = await fetch(data.publicUrl, { next: { revalidate: SNAPSHOT_REVALIDATE_SECONDS } });
+    if (!response.ok) {
+      return null;
+    }
+    return { data: (await response.json()) as T, etag: response.headers.get('etag') };
+  } catch {
+    return null;
+  }
+}
+
+function fromSnapshotArticle(article: SnapshotArticle): NewsArticle {
+  const { id, news_number, title, imageUrl, thumbnailUrl, category, publisher, description, date, readMoreUrl } = article;
+  return { id, news_number, title, imageUrl, thumbnailUrl, category, publisher, description, date: new Date(date), readMoreUrl };
+}
+
+// Snapshots are published periodically, so drop entries that expired since the last run
+function isUnexpired(entry: { expired_at?: string | null }, now: number): boolean {
+  return !entry.expired_at || new Date(entry.expired_at).getTime() > now;
+}
+
+// Get all non-expired articles grouped by category, as served by /api/news (null if no snapshot)
+export async function getGroupedNewsSnapshot(): Promise<{ news: Record<string, SnapshotArticle[]>; etag: string | null } | null> {
+  const snapshot = await fetchSnapshot<Record<string, SnapshotArticle[]>>('news/all.json');
+  if (!snapshot) {
+    return null;
+  }
+
+  const now = Date.now();
+  const news: Record<string, SnapshotArticle[]> = {};
+  let filtered = false;
+  for (const [category, articles] of Object.entries(snapshot.data)) {
+    news[category] = articles.filter((article) => isUnexpired(article, now));
+    filtered ||= news[category].length !== articles.length;
+  }
+
+  // The stored ETag describes the unfiltered file, so only reuse it when nothing was dropped
+  return { news, etag: filtered ? null : snapshot.etag };
+}
+
+// Get non-expired articles for one category, newest first; falls back to a live query
+export async function getNewsForCategory(categoryName: string): Promise<NewsArticle[]> {
+  const snapshot = await fetchSnapshot<SnapshotArticle[]>(`news/${categoryName.toLowerCase()}.json`);
+  // news/all.json is the grouped snapshot, not a category list
+  if (snapshot && Array.isArray(snapshot.data)) {
+    const now = Date.now();
+    return snapshot.data.filter((article) => isUnexpired(article, now)).map(fromSnapshotArticle);
+  }
+
+  const allArticles = await getAllNews();
+  return allArticles.filter(article =>
+    article.category?.toLowerCase().trim() === categoryName.toLowerCase().trim()
+  );
+}
+
 // Get all non-expired articles, sorted newest first
 export async function getAllNews(): Promise<NewsArticle[]> {
   const { data, error } = await supabase
@@ -44,6 +110,9 @@ function transformDBArticleToNewsArticle(dbArticle: DBArticle): NewsArticle {
     ? dbArticle.image_url
     : defaultImage;
 
+  // Card-sized WebP thumbnail generated during ingestion (cards only; pages keep the original)
+  const thumbnailUrl = dbArticle.thumbnails?.['640'];
+
   const articleDate = dbArticle.published_at
     ? new Date(dbArticle.published_at)
     : new Date(dbArticle.created_at);
@@ -57,6 +126,7 @@ function transformDBArticleToNewsArticle(dbArticle: DBArticle): NewsArticle {
     news_number: dbArticle.raw?.news_number as number || 0,
     title: dbArticle.title,
     imageUrl: imageUrl,
+    thumbnailUrl: thumbnailUrl,
     category: dbArticle.category,
     publisher: dbArticle.source,
     description: dbArticle.summary || '',
@@ -234,6 +304,14 @@ export async function getRelatedArticles(category: string, excludeId: string, li
 
 // Get active articles for sitemap (only 0-48h old)
 export async function getRecentArticlesForSitemap(): Promise<Array<{ id: string; title: string; date: Date }>> {
+  const snapshot = await fetchSnapshot<SnapshotSitemapEntry[]>('sitemap/articles.json');
+  if (snapshot) {
+    const nowMs = Date.now();
+    return snapshot.data
+      .filter((article) => isUnexpired(article, nowMs))
+      .map(({ id, title, date }) => ({ id, title, date: new Date(date) }));
+  }
+
   const now = new Date().toISOString();
 
   const { data, error } = await supabase
@@ -4,6 +4,7 @@ export interface NewsArticle {
     news_number: number;
     title: string;
     imageUrl: string;
+    thumbnailUrl?: string; // Card-sized WebP generated during ingestion, when available
     category: string;
     publisher: string;
     description: string;
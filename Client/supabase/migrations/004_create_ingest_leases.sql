@@ -0,0 +1,132 @@
+-- Work leases for multi-worker ingestion
+-- Each row is a unit of work (a feed URL or an article URL).
+-- Workers claim rows with claim_ingest_leases(), which uses FOR UPDATE SKIP LOCKED
+-- so concurrent workers never receive the same row. A claimed row is held until
+-- lease_expires_at; heartbeats extend it, and expired leases are claimable again.
+-- status: pending -> leased -> done (or back to pending when released after a failure)
+
+CREATE TABLE IF NOT EXISTS ingest_leases (
+  kind TEXT NOT NULL CHECK (kind IN ('feed', 'article')),
+  key TEXT NOT NULL,
+  status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'leased', 'done')),
+  worker_id TEXT,
+  lease_expires_at TIMESTAMPTZ,
+  attempts INT NOT NULL DEFAULT 0,
+  payload JSONB,
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (kind, key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingest_leases_claim ON ingest_leases(kind, status, updated_at);
+
+-- Service role only (bypasses RLS); no public access
+ALTER TABLE ingest_leases ENABLE ROW LEVEL SECURITY;
+
+-- Claim up to p_limit rows of p_kind for p_worker.
+-- Claimable: pending, leased with an expired lease, or (when p_refresh_seconds is set)
+-- done longer than p_refresh_seconds ago. Rows that reached p_max_attempts are skipped.
+CREATE OR REPLACE FUNCTION claim_ingest_leases(
+  p_kind TEXT,
+  p_worker TEXT,
+  p_limit INT,
+  p_lease_seconds INT,
+  p_max_attempts INT,
+  p_refresh_seconds INT DEFAULT NULL
+)
+RETURNS SETOF ingest_leases
+LANGUAGE sql
+AS $$
+  UPDATE ingest_leases l
+  SET status = 'leased',
+      worker_id = p_worker,
+      lease_expires_at = NOW() + make_interval(secs => p_lease_seconds),
+      attempts = CASE WHEN l.status = 'done' THEN 1 ELSE l.attempts + 1 END,
+      updated_at = NOW()
+  WHERE (l.kind, l.key) IN (
+    SELECT kind, key
+    FROM ingest_leases
+    WHERE kind = p_kind
+      AND (
+        (status = 'pending' AND attempts < p_max_attempts)
+        OR (status = 'leased' AND lease_expires_at < NOW() AND attempts < p_max_attempts)
+        OR (p_refresh_seconds IS NOT NULL AND status = 'done'
+            AND updated_at < NOW() - make_interval(secs => p_refresh_seconds))
+      )
+    ORDER BY updated_at
+    LIMIT p_limit
+    FOR UPDATE SKIP LOCKED
+  )
+  RETURNING l.*;
+$$;
+
+-- Extend the leases p_worker still holds on p_keys
+CREATE OR REPLACE FUNCTION heartbeat_ingest_leases(
+  p_kind TEXT,
+  p_worker TEXT,
+  p_keys TEXT[],
+  p_lease_seconds INT
+)
+RETURNS INT
+LANGUAGE sql
+AS $$
+  WITH extended AS (
+    UPDATE ingest_leases
+    SET lease_expires_at = NOW() + make_interval(secs => p_lease_seconds),
+        updated_at = NOW()
+    WHERE kind = p_kind
+      AND key = ANY(p_keys)
+      AND worker_id = p_worker
+      AND status = 'leased'
+    RETURNING 1
+  )
+  SELECT COUNT(*)::INT FROM extended;
+$$;
+
+-- Mark the leases p_worker still holds on p_keys as done (server time, so refresh checks agree)
+CREATE OR REPLACE FUNCTION complete_ingest_leases(
+  p_kind TEXT,
+  p_worker TEXT,
+  p_keys TEXT[]
+)
+RETURNS INT
+LANGUAGE sql
+AS $$
+  WITH completed AS (
+    UPDATE ingest_leases
+    SET status = 'done',
+        lease_expires_at = NULL,
+        updated_at = NOW()
+    WHERE kind = p_kind
+      AND key = ANY(p_keys)
+      AND worker_id = p_worker
+      AND status = 'leased'
+    RETURNING 1
+  )
+  SELECT COUNT(*)::INT FROM completed;
+$$;
+
+-- Return the leases p_worker holds on p_keys to pending after a failure.
+-- attempts is kept, so claim_ingest_leases stops retrying at p_max_attempts.
+CREATE OR REPLACE FUNCTION release_ingest_leases(
+  p_kind TEXT,
+  p_worker TEXT,
+  p_keys TEXT[]
+)
+RETURNS INT
+LANGUAGE sql
+AS $$
+  WITH released AS (
+    UPDATE ingest_leases
+    SET status = 'pending',
+        worker_id = NULL,
+        lease_expires_at = NULL,
+        updated_at = NOW()
+    WHERE kind = p_kind
+      AND key = ANY(p_keys)
+      AND worker_id = p_worker
+      AND status = 'leased'
+    RETURNING 1
+  )
+  SELECT COUNT(*)::INT FROM released;
+$$;
@@ -0,0 +1,10 @@
+-- Public storage bucket for precomputed feed snapshots
+-- Written by the ingestion pipeline (service role) at the end of each run:
+--   manifest.json           generated_at + ETag per file
+--   news/all.json           active articles grouped by category (same shape as /api/news)
+--   news/<category>.json    active articles for one category, newest first
+--   sitemap/articles.json   active article ids/titles/dates for the articles sitemap
+
+INSERT INTO storage.buckets (id, name, public)
+VALUES ('snapshots', 'snapshots', true)
+ON CONFLICT (id) DO NOTHING;
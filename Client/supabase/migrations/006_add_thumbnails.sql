@@ -0,0 +1,10 @@
+-- Add thumbnails column: resized WebP variants of image_url keyed by width
+-- e.g. {"320": "https://.../thumbnails/ab/ab12...-320.webp", "640": "...", "960": "..."}
+-- Files are stored in the public 'thumbnails' bucket, named by content hash.
+
+ALTER TABLE news_articles
+ADD COLUMN IF NOT EXISTS thumbnails JSONB;
+
+INSERT INTO storage.buckets (id, name, public)
+VALUES ('thumbnails', 'thumbnails', true)
+ON CONFLICT (id) DO NOTHING;
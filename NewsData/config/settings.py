@@ -26,7 +26,51 @@ MAX_ARTICLES_PER_FEED = 10
 MIN_CONTENT_LENGTH = 100
 MIN_TITLE_LENGTH = 10
 REQUEST_TIMEOUT = 15
+CONNECT_TIMEOUT = 5
+MIN_CONNECT_TIMEOUT = 2
+MIN_READ_TIMEOUT = 5
+LATENCY_WINDOW = 50
+HEDGE_MIN_SAMPLES = 5
+HEDGE_MIN_DELAY_SEC = 1.0
 MIN_IMAGE_WIDTH = 300
+TRIAGE_SIMILARITY = 0.8
+HEAD_CHUNK_SIZE = 8 * 1024
+HEAD_MAX_BYTES = 256 * 1024
+
+# Workers
+FETCH_WORKERS = 4
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", os.cpu_count() or 1))
+
+# Daemon polling (seconds)
+FEED_POLL_MIN_SEC = 120
+FEED_POLL_MAX_SEC = 3600
+FEED_POLL_INITIAL_SEC = 600
+FEED_POLL_JITTER = 0.1
+LIFECYCLE_INTERVAL_SEC = 3600
+
+# Worker leases (seconds)
+LEASE_SECONDS = 300
+LEASE_HEARTBEAT_SEC = 60
+LEASE_MAX_ATTEMPTS = 3
+LEASE_BATCH_SIZE = 16
+LEASE_FEED_REFRESH_SEC = 1800
+
+# Snapshots
+SNAPSHOT_BUCKET = "snapshots"
+SNAPSHOT_INTERVAL_SEC = 300
+
+# Spool
+SPOOL_PATH = os.getenv("SPOOL_PATH", "spool.sqlite3")
+SPOOL_MAX_ATTEMPTS = 5
+SPOOL_REPLAY_INTERVAL_SEC = 600
+
+# Thumbnails (optional, requires Pillow)
+THUMBNAILS_ENABLED = os.getenv("THUMBNAILS_ENABLED", "").lower() in ("1", "true", "yes")
+THUMBNAIL_WIDTHS = [320, 640, 960]
+THUMBNAIL_MAX_BYTES = 10 * 1024 * 1024
+THUMBNAIL_BUCKET = "thumbnails"
+THUMBNAIL_DIR = os.getenv("THUMBNAIL_DIR")  # local stand-in for the bucket
+THUMBNAIL_BASE_URL = os.getenv("THUMBNAIL_BASE_URL", "")
 
 # Fallback images
 FALLBACK_PLACEHOLDER_IMAGE = "https://media.istockphoto.com/id/1409309637/vector/breaking-news-label-banner-isolated-vector-design.jpg?s=2048x2048&w=is&k=20&c=rHMT7lr46TFGxQqLQHvSGD6r79AIeTVng-KYA6J1XKM="
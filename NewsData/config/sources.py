@@ -58,3 +58,25 @@ BLOCKED_PUBLISHERS = [
     "wsj.com",
     "ft.com",
 ]
+
+# Non-article URLs (video, live blogs, audio, galleries), skipped before extraction
+MEDIA_URL_PATTERNS = [
+    "/video/",
+    "/videos/",
+    "/live/",
+    "/podcast",
+    "/audio/",
+    "/gallery/",
+]
+
+PUBLISHER_MEDIA_URL_PATTERNS = {
+    "bbc.co.uk": ["/av/", "/sounds/", "/iplayer/", "/live-"],
+    "bbc.com": ["/av/", "/sounds/", "/iplayer/", "/live-"],
+    "theguardian.com": ["/picture/", "/ng-interactive/"],
+    "npr.org": ["/podcasts/", "/programs/"],
+    "aljazeera.com": ["/program/", "/liveblog/"],
+    "espn.com": ["/watch/", "/espnradio/"],
+    "marketwatch.com": ["/livecoverage/"],
+}
+
+MEDIA_TITLE_PREFIXES = ["live:", "watch:", "video:", "podcast:", "listen:", "in pictures:"]
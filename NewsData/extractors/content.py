@@ -1,8 +1,11 @@
 """Article content extraction using newspaper3k."""
 
 from dataclasses import dataclass
-from newspaper import Article
 from config.settings import MIN_CONTENT_LENGTH
+from extractors.metadata import HeadMetadata
+from extractors.parsing import ParsedArticle, parse_article
+from utils.http import fetch_hedged
+from utils.process_pool import run_cpu
 from utils.urls import get_publisher_name
 
 
@@ -13,30 +16,42 @@ class ExtractedContent:
     url: str
     publish_date: str | None
     publisher: str
+    image_candidates: list[str] | None = None  # None when the page itself was not parsed
 
 
-def extract_content(url: str, fallback_title: str = "", fallback_snippet: str = "") -> ExtractedContent | None:
-    """Extract article content from URL."""
+def extract_content(
+    url: str,
+    fallback_title: str = "",
+    fallback_snippet: str = "",
+    metadata: HeadMetadata | None = None,
+) -> ExtractedContent | None:
+    """Extract article content from URL.
+
+    When the page's <head> advertises an AMP version, slow fetches hedge to it.
+    """
     publisher = get_publisher_name(url)
+    amp_url = metadata.amphtml_url if metadata and metadata.amphtml_url != url else None
     
-    result = _extract_with_newspaper(url)
+    result = _extract_with_newspaper(url, hedge_url=amp_url)
     if result and len(result.text) >= MIN_CONTENT_LENGTH:
         return ExtractedContent(
             text=result.text,
             title=result.title or fallback_title,
-            url=result.url or url,
-            publish_date=result.publish_date.isoformat() if result.publish_date else None,
+            url=url,
+            publish_date=result.publish_date,
             publisher=publisher,
+            image_candidates=result.image_candidates,
         )
     
-    result = _extract_with_newspaper(f"{url}?amp")
+    result = _extract_with_newspaper(amp_url or f"{url}?amp")
     if result and len(result.text) >= MIN_CONTENT_LENGTH:
         return ExtractedContent(
             text=result.text,
             title=result.title or fallback_title,
             url=url,
-            publish_date=result.publish_date.isoformat() if result.publish_date else None,
+            publish_date=result.publish_date,
             publisher=publisher,
+            image_candidates=result.image_candidates,
         )
     
     if fallback_snippet and len(fallback_snippet) >= 50:
@@ -51,12 +66,10 @@ def extract_content(url: str, fallback_title: str = "", fallback_snippet: str =
     return None
 
 
-def _extract_with_newspaper(url: str):
-    """Extract article using newspaper3k."""
+def _extract_with_newspaper(url: str, hedge_url: str | None = None) -> ParsedArticle | None:
+    """Download on this thread, parse with newspaper3k in the process pool."""
     try:
-        article = Article(url)
-        article.download()
-        article.parse()
-        return article
+        response = fetch_hedged(url, hedge_url)
     except Exception:
         return None
+    return run_cpu(parse_article, url, response.content)
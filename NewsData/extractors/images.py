@@ -1,19 +1,18 @@
 """Article image extraction."""
 
 import re
-import requests
-from bs4 import BeautifulSoup
-from newspaper import Article
 
 from config.settings import (
     FALLBACK_PLACEHOLDER_IMAGE,
     MIN_IMAGE_WIDTH,
     PUBLISHER_DEFAULT_IMAGES,
-    REQUEST_TIMEOUT,
 )
 from config.sources import BLOCKED_PUBLISHERS
-from utils.http import DEFAULT_HEADERS
-from utils.urls import get_domain, normalize_url
+from extractors.metadata import HeadMetadata, extract_head_metadata
+from extractors.parsing import parse_image_candidates
+from utils.http import fetch_hedged
+from utils.process_pool import run_cpu
+from utils.urls import get_domain
 
 INVALID_PATTERNS = [
     "logo", "icon", "favicon", "avatar", "sprite", "badge", "brand",
@@ -23,60 +22,58 @@ INVALID_PATTERNS = [
 ]
 
 
-def extract_image(url: str) -> str:
-    """Extract best image from article URL."""
+def extract_image(
+    url: str,
+    metadata: HeadMetadata | None = None,
+    candidates: list[str] | None = None,
+) -> str:
+    """Extract best image from article URL.
+
+    Reuses already-fetched <head> metadata and page image candidates when given,
+    and only downloads the page again when no candidates are available.
+    """
     domain = get_domain(url)
     
     for blocked in BLOCKED_PUBLISHERS:
         if blocked in domain:
             return PUBLISHER_DEFAULT_IMAGES.get(blocked, FALLBACK_PLACEHOLDER_IMAGE)
     
-    image = _try_newspaper(url)
+    image = _try_head(url, metadata)
     if image and _is_valid(image):
         return image
     
-    image = _try_html(url)
+    image = _try_candidates(candidates) if candidates is not None else _try_html(url)
     if image and _is_valid(image):
         return image
     
     return PUBLISHER_DEFAULT_IMAGES.get(domain, FALLBACK_PLACEHOLDER_IMAGE)
 
 
-def _try_newspaper(url: str) -> str | None:
-    try:
-        article = Article(url)
-        article.download()
-        article.parse()
-        return article.top_image
-    except Exception:
+def _try_head(url: str, metadata: HeadMetadata | None = None) -> str | None:
+    metadata = metadata or extract_head_metadata(url)
+    if not metadata:
         return None
+    
+    for img in metadata.images:
+        if _is_valid(img):
+            return img
+    
+    return None
 
 
 def _try_html(url: str) -> str | None:
     try:
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
+        response = fetch_hedged(url)
     except Exception:
         return None
     
-    for meta in [
-        soup.find("meta", property="og:image"),
-        soup.find("meta", attrs={"name": "twitter:image"}),
-        soup.find("meta", property="article:image"),
-    ]:
-        if meta and meta.get("content"):
-            img = normalize_url(meta["content"], url)
-            if _is_valid(img):
-                return img
-    
-    for selector in ["article", "main", ".article-body", "[role='main']"]:
-        content = soup.select_one(selector)
-        if content:
-            for img in content.find_all("img", src=True)[:5]:
-                img_url = normalize_url(img.get("src") or img.get("data-src", ""), url)
-                if _is_valid(img_url):
-                    return img_url
+    return _try_candidates(run_cpu(parse_image_candidates, url, response.content))
+
+
+def _try_candidates(candidates: list[str]) -> str | None:
+    for img in candidates:
+        if _is_valid(img):
+            return img
     
     return None
 
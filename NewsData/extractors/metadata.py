@@ -0,0 +1,114 @@
+"""Streaming <head> metadata extraction (OpenGraph, Twitter, JSON-LD)."""
+
+import json
+from dataclasses import dataclass, field
+
+from lxml import etree
+
+from config.settings import HEAD_CHUNK_SIZE, HEAD_MAX_BYTES
+from utils.http import fetch_url
+from utils.urls import normalize_url
+
+IMAGE_KEYS = ["og:image", "twitter:image", "article:image"]
+TITLE_KEYS = ["og:title", "twitter:title"]
+PUBLISHED_KEYS = ["article:published_time", "og:published_time", "pubdate", "date"]
+
+
+@dataclass
+class HeadMetadata:
+    images: list[str] = field(default_factory=list)
+    title: str | None = None
+    published_time: str | None = None
+    canonical_url: str | None = None
+    amphtml_url: str | None = None
+
+
+def extract_head_metadata(url: str) -> HeadMetadata | None:
+    """Stream the page and parse only up to </head>."""
+    try:
+        response = fetch_url(url, stream=True)
+        response.raise_for_status()
+    except Exception:
+        return None
+
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    meta: dict[str, str] = {}
+    links: dict[str, str] = {}
+    ld_json: list[str] = []
+    doc_title = None
+    received = 0
+
+    try:
+        for chunk in response.iter_content(HEAD_CHUNK_SIZE):
+            parser.feed(chunk)
+            received += len(chunk)
+            done = False
+            for event, el in parser.read_events():
+                tag = el.tag if isinstance(el.tag, str) else ""
+                if event == "start" and tag == "meta":
+                    key = el.get("property") or el.get("name") or el.get("itemprop")
+                    if key and el.get("content"):
+                        meta.setdefault(key.lower(), el.get("content"))
+                elif event == "start" and tag == "link":
+                    rel = (el.get("rel") or "").lower()
+                    if rel and el.get("href"):
+                        links.setdefault(rel, el.get("href"))
+                elif event == "end" and tag == "title":
+                    doc_title = (el.text or "").strip() or None
+                elif event == "end" and tag == "script":
+                    if (el.get("type") or "").lower() == "application/ld+json":
+                        ld_json.append(el.text or "")
+                elif (event == "end" and tag == "head") or (event == "start" and tag == "body"):
+                    done = True
+            if done or received >= HEAD_MAX_BYTES:
+                break
+    except Exception:
+        return None
+    finally:
+        response.close()
+
+    ld = _first_ld_article(ld_json)
+
+    images = [meta[key] for key in IMAGE_KEYS if meta.get(key)]
+    ld_image = _ld_image(ld.get("image"))
+    if ld_image:
+        images.append(ld_image)
+    return HeadMetadata(
+        images=[normalize_url(image, url) for image in images],
+        title=_first(meta, TITLE_KEYS) or ld.get("headline") or doc_title,
+        published_time=_first(meta, PUBLISHED_KEYS) or ld.get("datePublished"),
+        canonical_url=normalize_url(links["canonical"], url) if "canonical" in links else None,
+        amphtml_url=normalize_url(links["amphtml"], url) if "amphtml" in links else None,
+    )
+
+
+def _first(meta: dict[str, str], keys: list[str]) -> str | None:
+    for key in keys:
+        if meta.get(key):
+            return meta[key].strip()
+    return None
+
+
+def _first_ld_article(blocks: list[str]) -> dict:
+    """Return the first JSON-LD object carrying article fields."""
+    for block in blocks:
+        try:
+            data = json.loads(block)
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            items = data.get("@graph", [data])
+        else:
+            items = data if isinstance(data, list) else []
+        for item in items:
+            if isinstance(item, dict) and ("headline" in item or "datePublished" in item):
+                return item
+    return {}
+
+
+def _ld_image(value) -> str | None:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get("url")
+    return value if isinstance(value, str) else None
@@ -0,0 +1,66 @@
+"""CPU-bound page parsing, run in the process pool on pre-downloaded HTML."""
+
+from dataclasses import dataclass, field
+
+import lxml.html
+from newspaper import Article
+
+from utils.urls import normalize_url
+
+META_IMAGE_XPATHS = [
+    "//meta[@property='og:image']/@content",
+    "//meta[@name='twitter:image']/@content",
+    "//meta[@property='article:image']/@content",
+]
+
+BODY_XPATHS = [
+    "//article",
+    "//main",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' article-body ')]",
+    "//*[@role='main']",
+]
+
+
+@dataclass
+class ParsedArticle:
+    text: str
+    title: str
+    publish_date: str | None
+    image_candidates: list[str] = field(default_factory=list)
+
+
+def parse_article(url: str, html: bytes) -> ParsedArticle | None:
+    """Parse article text, title, date and image candidates in one pool task."""
+    try:
+        article = Article(url, fetch_images=False)
+        article.download(input_html=html)
+        article.parse()
+    except Exception:
+        return None
+    return ParsedArticle(
+        text=article.text,
+        title=article.title,
+        publish_date=article.publish_date.isoformat() if article.publish_date else None,
+        image_candidates=parse_image_candidates(url, html),
+    )
+
+
+def parse_image_candidates(url: str, html: bytes) -> list[str]:
+    """Collect image candidates: meta tags first, then images in the article body."""
+    try:
+        doc = lxml.html.fromstring(html)
+    except Exception:
+        return []
+
+    candidates = []
+    for xpath in META_IMAGE_XPATHS:
+        for content in doc.xpath(xpath)[:1]:
+            candidates.append(normalize_url(content, url))
+
+    for xpath in BODY_XPATHS:
+        found = doc.xpath(xpath)
+        if found:
+            for img in found[0].xpath(".//img[@src]")[:5]:
+                candidates.append(normalize_url(img.get("src") or img.get("data-src", ""), url))
+
+    return [c for c in candidates if c]
@@ -0,0 +1,86 @@
+"""Bounded RSS/Atom parsing with lxml iterparse."""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+
+from lxml import etree
+
+# Qualified (Clark notation) tag names; RSS 2.0 elements have no namespace
+ATOM = "{http://www.w3.org/2005/Atom}"
+RSS1 = "{http://purl.org/rss/1.0/}"
+DC = "{http://purl.org/dc/elements/1.1/}"
+CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+
+ENTRY_TAGS = {"item", f"{RSS1}item", f"{ATOM}entry"}
+TITLE_TAGS = ["title", f"{RSS1}title", f"{ATOM}title"]
+LINK_TAGS = {"link", f"{RSS1}link"}
+SUMMARY_TAGS = ["description", f"{RSS1}description", f"{ATOM}summary", f"{CONTENT}encoded", f"{ATOM}content"]
+ID_TAGS = ["guid", f"{ATOM}id"]
+DATE_TAGS = ["pubDate", f"{ATOM}published", f"{DC}date"]
+
+
+def parse_feed(content: bytes, limit: int) -> list[dict] | None:
+    """Parse up to `limit` entries into feedparser-style dicts.
+
+    Returns None when the document is not well-formed RSS/Atom so the caller
+    can fall back to feedparser.
+    """
+    entries = []
+    try:
+        for _, el in etree.iterparse(
+            BytesIO(content), events=("end",), resolve_entities=False, no_network=True
+        ):
+            if el.tag not in ENTRY_TAGS:
+                continue
+            entries.append(_parse_item(el))
+            el.clear()
+            if len(entries) >= limit:
+                break
+    except etree.LxmlError:
+        return None
+    return entries or None
+
+
+def _parse_item(item) -> dict:
+    fields: dict[str, str] = {}
+    link = ""
+    for child in item:
+        if not isinstance(child.tag, str):
+            continue
+        if child.tag in LINK_TAGS:
+            link = link or (child.text or "").strip()
+        elif child.tag == f"{ATOM}link":
+            if child.get("rel", "alternate") == "alternate" and not link:
+                link = (child.get("href") or "").strip()
+        elif child.tag not in fields and child.text:
+            fields[child.tag] = child.text.strip()
+
+    return {
+        "link": link,
+        "title": _first(fields, TITLE_TAGS),
+        "summary": _first(fields, SUMMARY_TAGS),
+        "id": _first(fields, ID_TAGS) or link,
+        "published_parsed": _parse_date(_first(fields, DATE_TAGS)),
+    }
+
+
+def _first(fields: dict[str, str], tags: list[str]) -> str:
+    return next((fields[t] for t in tags if t in fields), "")
+
+
+def _parse_date(value: str):
+    """Parse RFC 822 or ISO 8601 dates into a UTC struct_time, like feedparser."""
+    if not value:
+        return None
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo:
+        dt = dt.astimezone(timezone.utc)
+    return dt.timetuple()
+
@@ -1,6 +1,5 @@
 """RSS feed fetching and parsing."""
 
-import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Generator
@@ -9,6 +8,9 @@ import feedparser
 
 from config.settings import MAX_ARTICLES_PER_FEED
 from config.sources import RSS_FEEDS
+from fetchers.feed_parser import parse_feed
+from utils.http import fetch_url
+from utils.html import strip_tags
 from utils.urls import is_aggregator_url
 
 
@@ -20,6 +22,7 @@ class RSSArticle:
     published_date: str | None
     source: str
     category: str
+    guid: str = ""
 
 
 def fetch_all_feeds() -> Generator[RSSArticle, None, None]:
@@ -28,21 +31,27 @@ def fetch_all_feeds() -> Generator[RSSArticle, None, None]:
         print(f"\nFetching {category} feeds...")
         for source_name, feed_url in feeds:
             print(f"  {source_name}...")
-            articles = _fetch_feed(feed_url, source_name, category)
+            articles = fetch_feed(feed_url, source_name, category)
             print(f"    Found {len(articles)} articles")
             yield from articles
 
 
-def _fetch_feed(feed_url: str, source_name: str, category: str) -> list[RSSArticle]:
+def fetch_feed(feed_url: str, source_name: str, category: str) -> list[RSSArticle]:
     """Fetch and parse a single RSS feed."""
     articles = []
     
     try:
-        feed = feedparser.parse(feed_url)
-        if feed.bozo and feed.bozo_exception:
-            print(f"  Warning: {source_name}: {feed.bozo_exception}")
+        response = fetch_url(feed_url)
+        response.raise_for_status()
         
-        for entry in feed.entries[:MAX_ARTICLES_PER_FEED]:
+        entries = parse_feed(response.content, MAX_ARTICLES_PER_FEED)
+        if entries is None:
+            feed = feedparser.parse(response.content)
+            if feed.bozo and feed.bozo_exception:
+                print(f"  Warning: {source_name}: {feed.bozo_exception}")
+            entries = feed.entries[:MAX_ARTICLES_PER_FEED]
+        
+        for entry in entries:
             article = _parse_entry(entry, source_name, category)
             if article:
                 articles.append(article)
@@ -63,13 +72,12 @@ def _parse_entry(entry, source_name: str, category: str) -> RSSArticle | None:
         return None
     
     snippet = entry.get("summary", "") or entry.get("description", "")
-    snippet = re.sub(r"<[^>]+>", "", snippet)
-    snippet = re.sub(r"\s+", " ", snippet).strip()
+    snippet = strip_tags(snippet)
     
     published_date = None
-    if hasattr(entry, "published_parsed") and entry.published_parsed:
+    if entry.get("published_parsed"):
         try:
-            published_date = datetime(*entry.published_parsed[:6]).isoformat()
+            published_date = datetime(*entry["published_parsed"][:6]).isoformat()
         except Exception:
             pass
     
@@ -80,4 +88,5 @@ def _parse_entry(entry, source_name: str, category: str) -> RSSArticle | None:
         published_date=published_date,
         source=source_name,
         category=category,
+        guid=entry.get("id", "") or link,
     )
@@ -0,0 +1,61 @@
+"""Adaptive per-feed polling schedule for daemon mode."""
+
+import random
+from dataclasses import dataclass, field
+
+from config.settings import (
+    FEED_POLL_INITIAL_SEC,
+    FEED_POLL_JITTER,
+    FEED_POLL_MAX_SEC,
+    FEED_POLL_MIN_SEC,
+    MAX_ARTICLES_PER_FEED,
+)
+from config.sources import RSS_FEEDS
+from fetchers.rss_fetcher import RSSArticle
+
+MAX_SEEN_LINKS = 500
+
+
+@dataclass
+class FeedSchedule:
+    source: str
+    url: str
+    category: str
+    interval: float = FEED_POLL_INITIAL_SEC
+    next_poll: float = 0.0
+    seen: dict[str, None] = field(default_factory=dict)
+
+    def record_poll(self, articles: list[RSSArticle], now: float) -> list[RSSArticle]:
+        """Return unseen articles and schedule the next poll from how many there were."""
+        first_poll = not self.seen
+        new = [a for a in articles if (a.guid or a.link) not in self.seen]
+        for article in new:
+            self.seen[article.guid or article.link] = None
+        while len(self.seen) > MAX_SEEN_LINKS:
+            del self.seen[next(iter(self.seen))]
+
+        if not first_poll:
+            self.interval = _next_interval(self.interval, len(new))
+        jitter = random.uniform(-FEED_POLL_JITTER, FEED_POLL_JITTER)
+        self.next_poll = now + self.interval * (1 + jitter)
+        return new
+
+
+def _next_interval(interval: float, new_count: int) -> float:
+    """Aim for a few new entries per poll: speed up when busy, back off when idle."""
+    if new_count == 0:
+        interval *= 1.5
+    elif new_count >= MAX_ARTICLES_PER_FEED // 2:
+        interval *= 0.5
+    elif new_count > 1:
+        interval *= 0.8
+    return min(max(interval, FEED_POLL_MIN_SEC), FEED_POLL_MAX_SEC)
+
+
+def build_schedules() -> list[FeedSchedule]:
+    """Create one schedule per configured feed, all due immediately."""
+    return [
+        FeedSchedule(source=source_name, url=feed_url, category=category)
+        for category, feeds in RSS_FEEDS.items()
+        for source_name, feed_url in feeds
+    ]
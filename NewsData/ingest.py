@@ -1,33 +1,59 @@
 #!/usr/bin/env python3
 """News ingestion pipeline using direct publisher RSS feeds."""
 
+import argparse
 import sys
 import time
+from dataclasses import asdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import nltk
 
 sys.path.insert(0, ".")
 
-from config.settings import MIN_CONTENT_LENGTH, MIN_TITLE_LENGTH
+from config.settings import (
+    FETCH_WORKERS,
+    LEASE_BATCH_SIZE,
+    LEASE_FEED_REFRESH_SEC,
+    LIFECYCLE_INTERVAL_SEC,
+    MIN_CONTENT_LENGTH,
+    MIN_TITLE_LENGTH,
+    SNAPSHOT_INTERVAL_SEC,
+    SPOOL_REPLAY_INTERVAL_SEC,
+    THUMBNAILS_ENABLED,
+)
 from extractors.content import extract_content
 from extractors.images import extract_image
-from fetchers.rss_fetcher import RSSArticle, fetch_all_feeds
+from extractors.metadata import extract_head_metadata
+from fetchers.rss_fetcher import RSSArticle, fetch_all_feeds, fetch_feed
+from fetchers.scheduler import build_schedules
 from processors.deduplicator import is_duplicate_fingerprint
 from processors.lifecycle import manage_lifecycle
 from processors.summarizer import summarize
-from storage.writer import ArticleData, insert_article
+from processors.thumbnails import create_thumbnails
+from processors.triage import triage
+from storage.leases import (
+    LeaseHeartbeat,
+    claim_leases,
+    complete_leases,
+    enqueue_articles,
+    purge_leases,
+    release_leases,
+    seed_feed_leases,
+)
+from storage.snapshots import publish_snapshots
+from storage.spool import replay_spool, store_article
+from storage.writer import ArticleData
 from utils.fingerprint import generate_story_fingerprint
-
-nltk.download("punkt", quiet=True)
-nltk.download("punkt_tab", quiet=True)
+from utils.process_pool import shutdown_pool
 
 
 def process_article(rss_article: RSSArticle) -> bool:
     """Process single article through pipeline."""
     url = rss_article.link
 
-    content = extract_content(url, rss_article.title, rss_article.snippet)
+    metadata = extract_head_metadata(url)
+    content = extract_content(url, rss_article.title, rss_article.snippet, metadata)
     if (
         not content
         or len(content.text) < MIN_CONTENT_LENGTH
@@ -43,12 +69,14 @@ def process_article(rss_article: RSSArticle) -> bool:
     if is_duplicate_fingerprint(fingerprint, content.title):
         return False
 
-    image_url = extract_image(url)
+    image_url = extract_image(url, metadata, content.image_candidates)
     summary = summarize(content.text)
     if not summary:
         return False
 
-    success = insert_article(
+    thumbnails = create_thumbnails(image_url) if THUMBNAILS_ENABLED else None
+
+    success = store_article(
         ArticleData(
             category=rss_article.category,
             title=content.title,
@@ -60,6 +88,7 @@ def process_article(rss_article: RSSArticle) -> bool:
             original_content=content.text,
             story_fingerprint=fingerprint,
             snippet=rss_article.snippet,
+            thumbnails=thumbnails,
         )
     )
 
@@ -68,6 +97,12 @@ def process_article(rss_article: RSSArticle) -> bool:
     return success
 
 
+def _replay_spool(min_age_sec: int = 0):
+    print("\nReplaying spool...")
+    stored, dropped = replay_spool(min_age_sec)
+    print(f"  Stored: {stored}, Dropped: {dropped}")
+
+
 def run_ingestion():
     """Run complete ingestion pipeline."""
     start_time = time.time()
@@ -80,14 +115,20 @@ def run_ingestion():
     expired, deleted = manage_lifecycle()
     print(f"  Expired: {expired}, Deleted: {deleted}")
 
+    _replay_spool()
+
     print("\nFetching RSS feeds...")
     articles = list(fetch_all_feeds())
     print(f"\nTotal articles: {len(articles)}")
 
+    print("\nTriaging...")
+    articles, rejected = triage(articles)
+    print(f"  Kept: {len(articles)}, Rejected: {dict(rejected)}")
+
     print("\nProcessing...")
     stored = 0
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
         futures = {executor.submit(process_article, a): a for a in articles}
         for future in as_completed(futures):
             try:
@@ -96,11 +137,152 @@ def run_ingestion():
             except Exception as e:
                 print(f"  Error: {e}")
 
+    shutdown_pool()
+
+    print("\nPublishing snapshots...")
+    print(f"  Uploaded: {publish_snapshots()}")
+
     print(f"\n{'=' * 60}")
     print(
         f"Complete: {stored}/{len(articles)} stored in {time.time() - start_time:.1f}s"
     )
 
 
+def _process_safely(rss_article: RSSArticle):
+    try:
+        process_article(rss_article)
+    except Exception as e:
+        print(f"  Error: {e}")
+
+
+def run_daemon():
+    """Poll each feed on its own adaptive schedule and process new entries continuously."""
+    print("=" * 60)
+    print("NEWS INGESTION DAEMON - Direct Publisher RSS")
+    print("=" * 60)
+
+    _replay_spool()
+
+    schedules = build_schedules()
+    next_lifecycle = 0.0
+    next_snapshot = time.monotonic() + SNAPSHOT_INTERVAL_SEC
+    next_replay = time.monotonic() + SPOOL_REPLAY_INTERVAL_SEC
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        try:
+            while True:
+                now = time.monotonic()
+                if now >= next_lifecycle:
+                    expired, deleted = manage_lifecycle()
+                    print(f"\nLifecycle - Expired: {expired}, Deleted: {deleted}")
+                    next_lifecycle = now + LIFECYCLE_INTERVAL_SEC
+
+                if now >= next_snapshot:
+                    print(f"\nSnapshots - Uploaded: {publish_snapshots()}")
+                    next_snapshot = now + SNAPSHOT_INTERVAL_SEC
+
+                # Retry writes that failed mid-run; skip rows a worker may still be inserting
+                if now >= next_replay:
+                    _replay_spool(min_age_sec=SPOOL_REPLAY_INTERVAL_SEC)
+                    next_replay = now + SPOOL_REPLAY_INTERVAL_SEC
+
+                feed = min(schedules, key=lambda s: s.next_poll)
+                if feed.next_poll > now:
+                    time.sleep(min(feed.next_poll, next_lifecycle, next_snapshot, next_replay) - now)
+                    continue
+
+                articles = fetch_feed(feed.url, feed.source, feed.category)
+                new = feed.record_poll(articles, time.monotonic())
+                new, rejected = triage(new)
+                print(
+                    f"  {feed.source}: {len(new)} new, {sum(rejected.values())} rejected,"
+                    f" next poll in {feed.interval / 60:.0f}m"
+                )
+                for article in new:
+                    executor.submit(_process_safely, article)
+        except KeyboardInterrupt:
+            print("\nStopping daemon...")
+
+    shutdown_pool()
+
+
+def run_worker():
+    """Claim feeds and articles through database leases until no work is left."""
+    start_time = time.time()
+
+    print("=" * 60)
+    print("NEWS INGESTION WORKER - Direct Publisher RSS")
+    print("=" * 60)
+
+    print("\nManaging lifecycle...")
+    expired, deleted = manage_lifecycle()
+    print(f"  Expired: {expired}, Deleted: {deleted}, Leases purged: {purge_leases()}")
+
+    _replay_spool()
+
+    seed_feed_leases()
+    processed = 0
+    stored = 0
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor, LeaseHeartbeat() as heartbeat:
+        while True:
+            feeds = claim_leases("feed", LEASE_BATCH_SIZE, refresh_seconds=LEASE_FEED_REFRESH_SEC)
+            for lease in feeds:
+                source, category = lease["payload"]["source"], lease["payload"]["category"]
+                print(f"  {source}...")
+                articles, _ = triage(fetch_feed(lease["key"], source, category))
+                enqueue_articles([asdict(a) for a in articles])
+                complete_leases("feed", [lease["key"]])
+
+            leases = claim_leases("article", LEASE_BATCH_SIZE)
+            if not feeds and not leases:
+                break
+
+            heartbeat.hold("article", [lease["key"] for lease in leases])
+            futures = {
+                executor.submit(process_article, RSSArticle(**lease["payload"])): lease["key"]
+                for lease in leases
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                processed += 1
+                try:
+                    if future.result():
+                        stored += 1
+                    complete_leases("article", [key])
+                except Exception as e:
+                    # Transient failures go back to the queue until LEASE_MAX_ATTEMPTS
+                    print(f"  Error: {e}")
+                    release_leases("article", [key])
+                heartbeat.release("article", [key])
+
+    shutdown_pool()
+
+    print("\nPublishing snapshots...")
+    print(f"  Uploaded: {publish_snapshots()}")
+
+    print(f"\n{'=' * 60}")
+    print(
+        f"Worker complete: {stored}/{processed} stored in {time.time() - start_time:.1f}s"
+    )
+
+
 if __name__ == "__main__":
-    run_ingestion()
+    nltk.download("punkt", quiet=True)
+    nltk.download("punkt_tab", quiet=True)
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--daemon", action="store_true", help="run continuously with adaptive feed polling"
+    )
+    parser.add_argument(
+        "--worker", action="store_true", help="share work with other workers via database leases"
+    )
+    args = parser.parse_args()
+
+    if args.daemon:
+        run_daemon()
+    elif args.worker:
+        run_worker()
+    else:
+        run_ingestion()
@@ -0,0 +1,131 @@
+"""Resized WebP thumbnails for article images."""
+
+import hashlib
+import io
+import threading
+from pathlib import Path
+
+from config.settings import (
+    FALLBACK_PLACEHOLDER_IMAGE,
+    PUBLISHER_DEFAULT_IMAGES,
+    THUMBNAIL_BASE_URL,
+    THUMBNAIL_BUCKET,
+    THUMBNAIL_DIR,
+    THUMBNAIL_MAX_BYTES,
+    THUMBNAIL_WIDTHS,
+)
+from storage.supabase_client import get_client
+from utils.http import fetch_url
+from utils.process_pool import run_cpu
+
+MAX_STORED_DIGESTS = 1000
+
+# Recently stored digests (least recently used first); _exists() covers anything evicted
+_stored: dict[str, dict[str, str]] = {}
+_stored_lock = threading.Lock()
+
+
+def create_thumbnails(image_url: str) -> dict[str, str] | None:
+    """Download an image once and store WebP variants. Returns {width: url}."""
+    if image_url == FALLBACK_PLACEHOLDER_IMAGE or image_url in PUBLISHER_DEFAULT_IMAGES.values():
+        return None
+    if THUMBNAIL_DIR and not THUMBNAIL_BASE_URL:
+        # Local files are only useful to the frontend when served from a URL
+        return None
+
+    data = _download(image_url)
+    if not data:
+        return None
+
+    digest = hashlib.sha256(data).hexdigest()
+    with _stored_lock:
+        if digest in _stored:
+            _stored[digest] = _stored.pop(digest)
+            return _stored[digest]
+
+    paths = {width: f"{digest[:2]}/{digest}-{width}.webp" for width in THUMBNAIL_WIDTHS}
+    if not _exists(paths[THUMBNAIL_WIDTHS[-1]]):
+        try:
+            rendered = run_cpu(render_thumbnails, data, THUMBNAIL_WIDTHS)
+        except Exception as e:
+            print(f"  Thumbnail error: {e}")
+            return None
+        for width, body in rendered.items():
+            if not _write(paths[width], body):
+                return None
+
+    urls = {str(width): _public_url(path) for width, path in paths.items()}
+    with _stored_lock:
+        _stored[digest] = urls
+        while len(_stored) > MAX_STORED_DIGESTS:
+            del _stored[next(iter(_stored))]
+    return urls
+
+
+def render_thumbnails(data: bytes, widths: list[int]) -> dict[int, bytes]:
+    """Resize to each width (capped at the source width) and encode as WebP. Runs in the process pool."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+        rendered = {}
+        for width in widths:
+            target = min(width, image.width)
+            height = round(image.height * target / image.width)
+            out = io.BytesIO()
+            image.resize((target, height), Image.LANCZOS).save(out, "WEBP", quality=80, method=4)
+            rendered[width] = out.getvalue()
+        return rendered
+
+
+def _download(image_url: str) -> bytes | None:
+    try:
+        response = fetch_url(image_url, stream=True)
+        response.raise_for_status()
+    except Exception:
+        return None
+
+    data = bytearray()
+    try:
+        for chunk in response.iter_content(64 * 1024):
+            data.extend(chunk)
+            if len(data) > THUMBNAIL_MAX_BYTES:
+                return None
+    except Exception:
+        return None
+    finally:
+        response.close()
+    return bytes(data)
+
+
+def _exists(path: str) -> bool:
+    try:
+        if THUMBNAIL_DIR:
+            return (Path(THUMBNAIL_DIR) / path).exists()
+        return get_client().storage.from_(THUMBNAIL_BUCKET).exists(path)
+    except Exception:
+        return False
+
+
+def _write(path: str, body: bytes) -> bool:
+    try:
+        if THUMBNAIL_DIR:
+            target = Path(THUMBNAIL_DIR) / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(body)
+        else:
+            get_client().storage.from_(THUMBNAIL_BUCKET).upload(
+                path,
+                body,
+                {"content-type": "image/webp", "cache-control": "31536000", "upsert": "true"},
+            )
+        return True
+    except Exception as e:
+        print(f"  Thumbnail upload error ({path}): {e}")
+        return False
+
+
+def _public_url(path: str) -> str:
+    if THUMBNAIL_DIR:
+        return f"{THUMBNAIL_BASE_URL.rstrip('/')}/{path}"
+    return get_client().storage.from_(THUMBNAIL_BUCKET).get_public_url(path)
@@ -0,0 +1,70 @@
+"""Pre-extraction triage using RSS metadata only."""
+
+import re
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from config.settings import ARTICLE_EXPIRE_HOURS, TRIAGE_SIMILARITY
+from config.sources import (
+    MEDIA_TITLE_PREFIXES,
+    MEDIA_URL_PATTERNS,
+    PUBLISHER_MEDIA_URL_PATTERNS,
+)
+from fetchers.rss_fetcher import RSSArticle
+from utils.urls import get_domain
+
+
+def triage(articles: list[RSSArticle]) -> tuple[list[RSSArticle], Counter]:
+    """Drop entries not worth extracting; newest first. Returns (kept, rejection counts)."""
+    rejected = Counter()
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=ARTICLE_EXPIRE_HOURS)
+    kept = []
+    kept_tokens = []
+
+    for article in articles:
+        reason = _rejection_reason(article, cutoff)
+        if not reason:
+            tokens = _tokens(f"{article.title} {article.snippet}")
+            if any(_jaccard(tokens, other) >= TRIAGE_SIMILARITY for other in kept_tokens):
+                reason = "near_duplicate"
+            else:
+                kept_tokens.append(tokens)
+        if reason:
+            rejected[reason] += 1
+        else:
+            kept.append(article)
+
+    kept.sort(key=lambda a: a.published_date or "", reverse=True)
+    return kept, rejected
+
+
+def _rejection_reason(article: RSSArticle, cutoff: datetime) -> str | None:
+    url = article.link.lower()
+    domain = get_domain(url)
+    patterns = MEDIA_URL_PATTERNS + next(
+        (p for d, p in PUBLISHER_MEDIA_URL_PATTERNS.items() if domain.endswith(d)), []
+    )
+    if any(p in url for p in patterns):
+        return "media_url"
+
+    if article.title.lower().startswith(tuple(MEDIA_TITLE_PREFIXES)):
+        return "media_title"
+
+    if article.published_date:
+        try:
+            if datetime.fromisoformat(article.published_date) < cutoff:
+                return "stale"
+        except ValueError:
+            pass
+
+    return None
+
+
+def _tokens(text: str) -> set[str]:
+    return set(re.findall(r"\w+", text.lower()))
+
+
+def _jaccard(a: set[str], b: set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
@@ -0,0 +1,169 @@
+"""Database-backed work leases for multi-worker ingestion."""
+
+import os
+import socket
+import threading
+from datetime import datetime, timedelta, timezone
+
+from config.settings import (
+    ARTICLE_DELETE_DAYS,
+    LEASE_HEARTBEAT_SEC,
+    LEASE_MAX_ATTEMPTS,
+    LEASE_SECONDS,
+)
+from config.sources import RSS_FEEDS
+from storage.supabase_client import get_client
+
+WORKER_ID = f"{socket.gethostname()}-{os.getpid()}"
+
+
+def seed_feed_leases():
+    """Ensure every configured feed has a lease row, and drop rows for removed feeds."""
+    rows = [
+        {
+            "kind": "feed",
+            "key": feed_url,
+            "payload": {"source": source_name, "category": category},
+        }
+        for category, feeds in RSS_FEEDS.items()
+        for source_name, feed_url in feeds
+    ]
+    try:
+        table = get_client().table("ingest_leases")
+        table.upsert(rows, on_conflict="kind,key", ignore_duplicates=True).execute()
+        table.delete().eq("kind", "feed").not_.in_("key", [r["key"] for r in rows]).execute()
+    except Exception as e:
+        print(f"  Lease seed error: {e}")
+
+
+def enqueue_articles(payloads: list[dict]):
+    """Add article work items; URLs already seen by any worker are ignored."""
+    if not payloads:
+        return
+    rows = [{"kind": "article", "key": p["link"], "payload": p} for p in payloads]
+    try:
+        get_client().table("ingest_leases").upsert(
+            rows, on_conflict="kind,key", ignore_duplicates=True
+        ).execute()
+    except Exception as e:
+        print(f"  Lease enqueue error: {e}")
+
+
+def claim_leases(kind: str, limit: int, refresh_seconds: int | None = None) -> list[dict]:
+    """Claim up to `limit` work items of `kind` for this worker."""
+    try:
+        result = get_client().rpc(
+            "claim_ingest_leases",
+            {
+                "p_kind": kind,
+                "p_worker": WORKER_ID,
+                "p_limit": limit,
+                "p_lease_seconds": LEASE_SECONDS,
+                "p_max_attempts": LEASE_MAX_ATTEMPTS,
+                "p_refresh_seconds": refresh_seconds,
+            },
+        ).execute()
+        return result.data or []
+    except Exception as e:
+        print(f"  Lease claim error: {e}")
+        return []
+
+
+def release_leases(kind: str, keys: list[str]):
+    """Return failed items held by this worker to the queue (claims still count attempts)."""
+    if not keys:
+        return
+    try:
+        get_client().rpc(
+            "release_ingest_leases",
+            {"p_kind": kind, "p_worker": WORKER_ID, "p_keys": keys},
+        ).execute()
+    except Exception as e:
+        print(f"  Lease release error: {e}")
+
+
+def complete_leases(kind: str, keys: list[str]):
+    """Mark items held by this worker as done."""
+    if not keys:
+        return
+    try:
+        get_client().rpc(
+            "complete_ingest_leases",
+            {"p_kind": kind, "p_worker": WORKER_ID, "p_keys": keys},
+        ).execute()
+    except Exception as e:
+        print(f"  Lease complete error: {e}")
+
+
+def purge_leases() -> int:
+    """Delete finished article leases past the retention window, and articles out of attempts."""
+    now = datetime.now(timezone.utc)
+    cutoff = (now - timedelta(days=ARTICLE_DELETE_DAYS)).isoformat()
+    try:
+        finished = (
+            get_client()
+            .table("ingest_leases")
+            .delete()
+            .eq("kind", "article")
+            .eq("status", "done")
+            .lt("updated_at", cutoff)
+            .execute()
+        )
+        # Exhausted rows are never claimed again; skip ones a worker still holds
+        exhausted = (
+            get_client()
+            .table("ingest_leases")
+            .delete()
+            .eq("kind", "article")
+            .neq("status", "done")
+            .gte("attempts", LEASE_MAX_ATTEMPTS)
+            .or_(f"status.eq.pending,lease_expires_at.lt.{now.isoformat()}")
+            .execute()
+        )
+        return len(finished.data or []) + len(exhausted.data or [])
+    except Exception:
+        return 0
+
+
+class LeaseHeartbeat:
+    """Background thread that keeps held leases from expiring."""
+
+    def __init__(self):
+        self._held: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def hold(self, kind: str, keys: list[str]):
+        with self._lock:
+            self._held.setdefault(kind, set()).update(keys)
+
+    def release(self, kind: str, keys: list[str]):
+        with self._lock:
+            self._held.get(kind, set()).difference_update(keys)
+
+    def _run(self):
+        while not self._stop.wait(LEASE_HEARTBEAT_SEC):
+            with self._lock:
+                held = {kind: list(keys) for kind, keys in self._held.items() if keys}
+            for kind, keys in held.items():
+                try:
+                    get_client().rpc(
+                        "heartbeat_ingest_leases",
+                        {
+                            "p_kind": kind,
+                            "p_worker": WORKER_ID,
+                            "p_keys": keys,
+                            "p_lease_seconds": LEASE_SECONDS,
+                        },
+                    ).execute()
+                except Exception as e:
+                    print(f"  Lease heartbeat error: {e}")
@@ -0,0 +1,118 @@
+"""Precomputed feed snapshots served directly by the frontend."""
+
+import hashlib
+import json
+from datetime import datetime
+
+from config.settings import FALLBACK_PLACEHOLDER_IMAGE, SNAPSHOT_BUCKET, THUMBNAILS_ENABLED
+from config.sources import RSS_FEEDS
+from storage.supabase_client import get_client
+
+MANIFEST_PATH = "manifest.json"
+CARD_THUMBNAIL_WIDTH = "640"
+COLUMNS = "id, category, title, summary, image_url, source, published_at, article_url, raw, created_at, expired_at"
+
+
+def publish_snapshots() -> int:
+    """Write active articles as per-category JSON snapshots. Returns files uploaded."""
+    now_iso = datetime.now().isoformat()
+    # The thumbnails column only exists once migration 006 has been applied
+    columns = f"{COLUMNS}, thumbnails" if THUMBNAILS_ENABLED else COLUMNS
+    try:
+        result = (
+            get_client()
+            .table("news_articles")
+            .select(columns)
+            .eq("expired", False)
+            .or_(f"expired_at.gt.{now_iso},expired_at.is.null")
+            .order("published_at", desc=True, nullsfirst=False)
+            .order("created_at", desc=True)
+            .execute()
+        )
+    except Exception as e:
+        print(f"  Snapshot query error: {e}")
+        return 0
+
+    rows = result.data or []
+    grouped: dict[str, list[dict]] = {}
+    for row in rows:
+        article = _to_news_article(row)
+        grouped.setdefault(article["category"] or "All", []).append(article)
+
+    files = {"news/all.json": grouped}
+    for category in {*RSS_FEEDS, *grouped}:
+        path = f"news/{category.lower()}.json"
+        # Uncategorized rows are grouped as "All"; never overwrite the grouped snapshot with them
+        if path not in files:
+            files[path] = grouped.get(category, [])
+    files["sitemap/articles.json"] = [
+        {
+            "id": row["id"],
+            "title": row["title"],
+            "date": row["published_at"] or row["created_at"],
+            "expired_at": row.get("expired_at"),
+        }
+        for row in rows
+    ]
+
+    bucket = get_client().storage.from_(SNAPSHOT_BUCKET)
+    previous = _load_manifest(bucket)
+    manifest = {"generated_at": now_iso, "files": {}}
+    uploaded = 0
+
+    for path, data in files.items():
+        body = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        manifest["files"][path] = etag
+        if previous.get(path) == etag:
+            continue
+        if _upload(bucket, path, body):
+            uploaded += 1
+        else:
+            manifest["files"].pop(path)
+
+    _upload(bucket, MANIFEST_PATH, json.dumps(manifest, indent=2).encode("utf-8"))
+    return uploaded
+
+
+def _to_news_article(row: dict) -> dict:
+    """Match the frontend NewsArticle shape (see Client/lib/news/repository.ts)."""
+    raw = row.get("raw") or {}
+    article = {
+        "id": row["id"],
+        "news_number": raw.get("news_number") or 0,
+        "title": row["title"],
+        "imageUrl": (row.get("image_url") or "").strip() or FALLBACK_PLACEHOLDER_IMAGE,
+        "category": row["category"],
+        "publisher": row["source"],
+        "description": row.get("summary") or "",
+        "date": row["published_at"] or row["created_at"],
+        "readMoreUrl": (row.get("article_url") or "").strip() or "#",
+        # Lets readers drop articles that expire between snapshot runs
+        "expired_at": row.get("expired_at"),
+    }
+    # Card components prefer the thumbnail; article pages keep the original image
+    thumbnail = (row.get("thumbnails") or {}).get(CARD_THUMBNAIL_WIDTH)
+    if thumbnail:
+        article["thumbnailUrl"] = thumbnail
+    return article
+
+
+def _load_manifest(bucket) -> dict:
+    try:
+        return json.loads(bucket.download(MANIFEST_PATH)).get("files", {})
+    except Exception:
+        return {}
+
+
+def _upload(bucket, path: str, body: bytes) -> bool:
+    try:
+        bucket.upload(
+            path,
+            body,
+            {"content-type": "application/json", "cache-control": "60", "upsert": "true"},
+        )
+        return True
+    except Exception as e:
+        print(f"  Snapshot upload error ({path}): {e}")
+        return False
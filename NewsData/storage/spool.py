@@ -0,0 +1,95 @@
+"""Local write-ahead spool for processed articles awaiting a database write."""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import asdict
+
+from config.settings import SPOOL_MAX_ATTEMPTS, SPOOL_PATH
+from storage.writer import ArticleData, insert_article, insert_articles
+
+
+@contextmanager
+def _connect():
+    """Open the spool, commit on success, always close."""
+    conn = sqlite3.connect(SPOOL_PATH, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS spool (
+            fingerprint TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            committed INTEGER NOT NULL DEFAULT 0,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )"""
+    )
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def spool_article(article: ArticleData):
+    """Persist a processed article before it is written to the database."""
+    with _connect() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO spool (fingerprint, data) VALUES (?, ?)",
+            (article.story_fingerprint, json.dumps(asdict(article))),
+        )
+
+
+def mark_committed(fingerprints: list[str]):
+    """Mark spooled articles as stored in the database."""
+    with _connect() as conn:
+        conn.executemany(
+            "UPDATE spool SET committed = 1 WHERE fingerprint = ?",
+            [(f,) for f in fingerprints],
+        )
+
+
+def store_article(article: ArticleData) -> bool:
+    """Spool, insert, and mark committed on success. Spool errors never block the insert."""
+    try:
+        spool_article(article)
+    except sqlite3.Error as e:
+        print(f"  Spool error: {e}")
+    if not insert_article(article):
+        return False
+    try:
+        mark_committed([article.story_fingerprint])
+    except sqlite3.Error as e:
+        print(f"  Spool error: {e}")
+    return True
+
+
+def replay_spool(min_age_sec: int = 0) -> tuple[int, int]:
+    """Insert articles left uncommitted by earlier runs. Returns (stored, dropped).
+
+    `min_age_sec` skips rows spooled more recently, whose first insert may still be in flight.
+    """
+    pending = "committed = 0 AND created_at <= datetime('now', ?)"
+    age = f"-{min_age_sec} seconds"
+    with _connect() as conn:
+        conn.execute("DELETE FROM spool WHERE committed = 1")
+        conn.execute(f"UPDATE spool SET attempts = attempts + 1 WHERE {pending}", (age,))
+        rows = conn.execute(
+            f"SELECT fingerprint, data FROM spool WHERE {pending}", (age,)
+        ).fetchall()
+
+    if not rows:
+        return 0, 0
+
+    articles = [ArticleData(**json.loads(data)) for _, data in rows]
+    if insert_articles(articles):
+        stored = [a.story_fingerprint for a in articles]
+    else:
+        stored = [a.story_fingerprint for a in articles if insert_article(a)]
+    mark_committed(stored)
+
+    with _connect() as conn:
+        dropped = conn.execute(
+            "DELETE FROM spool WHERE committed = 0 AND attempts >= ?",
+            (SPOOL_MAX_ATTEMPTS,),
+        ).rowcount
+    return len(stored), dropped
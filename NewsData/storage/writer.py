@@ -17,29 +17,47 @@ class ArticleData:
     original_content: str
     story_fingerprint: str
     snippet: str = ""
+    thumbnails: dict[str, str] | None = None
 
 
 def insert_article(article: ArticleData) -> bool:
     """Insert article into database."""
-    lifecycle = calculate_lifecycle_dates(article.published_at)
-    
     try:
-        get_client().table("news_articles").insert({
-            "category": article.category,
-            "title": article.title,
-            "summary": article.summary,
-            "image_url": article.image_url,
-            "source": article.source,
-            "published_at": article.published_at,
-            "article_url": article.article_url,
-            "story_fingerprint": article.story_fingerprint,
-            "expired": False,
-            "expired_at": lifecycle["expired_at"],
-            "gone_at": lifecycle["gone_at"],
-            "deleted_at": lifecycle["deleted_at"],
-            "raw": {"snippet": article.snippet, "original_content": article.original_content},
-        }).execute()
+        get_client().table("news_articles").insert(_to_row(article)).execute()
         return True
     except Exception as e:
         print(f"  Insert error: {e}")
         return False
+
+
+def insert_articles(articles: list[ArticleData]) -> bool:
+    """Insert several articles in one request (all or nothing)."""
+    try:
+        get_client().table("news_articles").insert([_to_row(a) for a in articles]).execute()
+        return True
+    except Exception as e:
+        print(f"  Bulk insert error: {e}")
+        return False
+
+
+def _to_row(article: ArticleData) -> dict:
+    lifecycle = calculate_lifecycle_dates(article.published_at)
+    row = {
+        "category": article.category,
+        "title": article.title,
+        "summary": article.summary,
+        "image_url": article.image_url,
+        "source": article.source,
+        "published_at": article.published_at,
+        "article_url": article.article_url,
+        "story_fingerprint": article.story_fingerprint,
+        "expired": False,
+        "expired_at": lifecycle["expired_at"],
+        "gone_at": lifecycle["gone_at"],
+        "deleted_at": lifecycle["deleted_at"],
+        "raw": {"snippet": article.snippet, "original_content": article.original_content},
+    }
+    # Only send the column when thumbnails were generated, so it is optional until migration 006
+    if article.thumbnails is not None:
+        row["thumbnails"] = article.thumbnails
+    return row
@@ -0,0 +1,109 @@
+"""Bounded lxml feed parsing."""
+
+from fetchers.feed_parser import parse_feed
+from fetchers.rss_fetcher import _parse_entry
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:media="http://search.yahoo.com/mrss/">
+  <channel>
+    <title>Channel title</title>
+    <link>https://example.com/</link>
+    <item>
+      <media:title>MEDIA</media:title>
+      <media:description>media description</media:description>
+      <title>First story headline</title>
+      <link>https://example.com/news/1</link>
+      <description><![CDATA[<p>First &amp; <b>best</b></p>]]></description>
+      <guid isPermaLink="false">story-1</guid>
+      <pubDate>Sun, 18 Oct 2026 09:30:00 +0200</pubDate>
+    </item>
+    <item>
+      <title>Second story headline</title>
+      <link>https://example.com/news/2</link>
+      <content:encoded>Encoded body</content:encoded>
+      <dc:date>2026-10-18T10:00:00Z</dc:date>
+    </item>
+  </channel>
+</rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Feed title</title>
+  <entry>
+    <title>Atom story headline</title>
+    <link rel="enclosure" href="https://example.com/a.mp3"/>
+    <link rel="alternate" href="https://example.com/atom/1"/>
+    <id>tag:example.com,2026:1</id>
+    <published>2026-10-18T09:00:00Z</published>
+    <updated>2026-10-18T11:00:00Z</updated>
+    <summary>Atom summary</summary>
+  </entry>
+</feed>"""
+
+RDF = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel rdf:about="https://example.com/"><title>RDF channel</title></channel>
+  <item rdf:about="https://example.com/rdf/1">
+    <title>RDF story headline</title>
+    <link>https://example.com/rdf/1</link>
+    <description>RDF description</description>
+    <dc:date>2026-10-18T08:00:00+00:00</dc:date>
+  </item>
+</rdf:RDF>"""
+
+
+def test_rss_ignores_namespaced_lookalikes():
+    first, second = parse_feed(RSS, 10)
+    assert first["title"] == "First story headline"
+    assert first["summary"] == "<p>First &amp; <b>best</b></p>"
+    assert first["link"] == "https://example.com/news/1"
+    assert first["id"] == "story-1"
+    assert tuple(first["published_parsed"][:6]) == (2026, 10, 18, 7, 30, 0)
+
+    assert second["summary"] == "Encoded body"
+    assert second["id"] == "https://example.com/news/2"
+    assert tuple(second["published_parsed"][:4]) == (2026, 10, 18, 10)
+
+
+def test_atom_uses_alternate_link_and_published():
+    (entry,) = parse_feed(ATOM, 10)
+    assert entry["title"] == "Atom story headline"
+    assert entry["link"] == "https://example.com/atom/1"
+    assert entry["id"] == "tag:example.com,2026:1"
+    assert entry["summary"] == "Atom summary"
+    assert tuple(entry["published_parsed"][:4]) == (2026, 10, 18, 9)
+
+
+def test_rdf_items():
+    (entry,) = parse_feed(RDF, 10)
+    assert entry["title"] == "RDF story headline"
+    assert entry["link"] == "https://example.com/rdf/1"
+    assert entry["summary"] == "RDF description"
+    assert tuple(entry["published_parsed"][:4]) == (2026, 10, 18, 8)
+
+
+def test_stops_at_limit_before_malformed_tail():
+    items = b"".join(
+        b"<item><title>Story %d headline</title><link>https://example.com/%d</link></item>" % (i, i)
+        for i in range(5)
+    )
+    truncated = b"<rss><channel>" + items + b"<item><title>broken"
+    entries = parse_feed(truncated, 3)
+    assert [e["link"] for e in entries] == [f"https://example.com/{i}" for i in range(3)]
+
+
+def test_malformed_or_non_feed_falls_back():
+    assert parse_feed(b"<rss><channel><item><title>x</tit", 10) is None
+    assert parse_feed(b"<html><body>not a feed</body></html>", 10) is None
+
+
+def test_entries_feed_parse_entry():
+    article = _parse_entry(parse_feed(RSS, 10)[0], "Example", "AI")
+    assert article.title == "First story headline"
+    assert article.snippet == "First & best"
+    assert article.published_date == "2026-10-18T07:30:00"
+    assert article.guid == "story-1"
@@ -0,0 +1,116 @@
+"""Tests for per-domain latency tracking and hedged fetches."""
+
+import threading
+import time
+
+import pytest
+
+from config.settings import (
+    CONNECT_TIMEOUT,
+    HEDGE_MIN_DELAY_SEC,
+    HEDGE_MIN_SAMPLES,
+    LATENCY_WINDOW,
+    MIN_CONNECT_TIMEOUT,
+    MIN_READ_TIMEOUT,
+    REQUEST_TIMEOUT,
+)
+from utils import http, latency
+
+
+@pytest.fixture(autouse=True)
+def fresh_samples(monkeypatch):
+    monkeypatch.setattr(latency, "_samples", {})
+    monkeypatch.setattr(latency, "_first_byte", {})
+
+
+def _record(domain, *seconds):
+    for s in seconds:
+        latency.record(domain, s)
+
+
+def test_percentile_needs_min_samples():
+    _record("example.com", *[1.0] * (HEDGE_MIN_SAMPLES - 1))
+    assert latency.percentile("example.com", 0.5) is None
+    assert latency.percentile("other.com", 0.5) is None
+
+
+def test_percentile_uses_recent_window_per_domain():
+    _record("example.com", *[100.0] * LATENCY_WINDOW)
+    _record("example.com", *range(1, LATENCY_WINDOW + 1))
+    _record("other.com", *[9.0] * HEDGE_MIN_SAMPLES)
+
+    assert latency.percentile("example.com", 0.0) == 1
+    assert latency.percentile("example.com", 1.0) == LATENCY_WINDOW
+    assert latency.percentile("other.com", 0.5) == 9.0
+
+
+def test_timeouts_for_unknown_domain_use_defaults():
+    assert latency.timeouts_for("example.com") == (CONNECT_TIMEOUT, REQUEST_TIMEOUT)
+
+
+def test_timeouts_for_scale_with_p99_within_bounds():
+    _record("fast.com", *[0.1] * HEDGE_MIN_SAMPLES)
+    _record("medium.com", *[(MIN_READ_TIMEOUT + REQUEST_TIMEOUT) / 4] * HEDGE_MIN_SAMPLES)
+    _record("slow.com", *[REQUEST_TIMEOUT] * HEDGE_MIN_SAMPLES)
+
+    assert latency.timeouts_for("fast.com") == (CONNECT_TIMEOUT, MIN_READ_TIMEOUT)
+    assert latency.timeouts_for("medium.com") == (CONNECT_TIMEOUT, (MIN_READ_TIMEOUT + REQUEST_TIMEOUT) / 2)
+    assert latency.timeouts_for("slow.com") == (CONNECT_TIMEOUT, REQUEST_TIMEOUT)
+
+
+def test_connect_timeout_follows_first_byte_p99():
+    for _ in range(HEDGE_MIN_SAMPLES):
+        latency.record_first_byte("fast.com", 0.2)
+        latency.record_first_byte("medium.com", (MIN_CONNECT_TIMEOUT + CONNECT_TIMEOUT) / 4)
+        latency.record_first_byte("slow.com", CONNECT_TIMEOUT)
+
+    assert latency.timeouts_for("fast.com") == (MIN_CONNECT_TIMEOUT, REQUEST_TIMEOUT)
+    assert latency.timeouts_for("medium.com")[0] == (MIN_CONNECT_TIMEOUT + CONNECT_TIMEOUT) / 2
+    assert latency.timeouts_for("slow.com")[0] == CONNECT_TIMEOUT
+
+
+def test_first_byte_samples_are_separate_from_response_times():
+    _record("example.com", *[3.0] * HEDGE_MIN_SAMPLES)
+    assert latency.percentile("example.com", 0.5, first_byte=True) is None
+    latency.record_first_byte("example.com", 0.5)
+    assert latency.percentile("example.com", 0.5) == 3.0
+
+
+def test_hedge_delay_waits_for_samples():
+    _record("example.com", *[0.1] * (HEDGE_MIN_SAMPLES - 1))
+    assert latency.hedge_delay("example.com") is None
+
+    _record("example.com", 0.1)
+    assert latency.hedge_delay("example.com") == HEDGE_MIN_DELAY_SEC
+
+
+def test_hedge_delay_tracks_p95():
+    _record("example.com", *range(1, 21))
+    assert latency.hedge_delay("example.com") == 19
+
+
+def test_fetch_hedged_without_samples_fetches_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(http, "_fetch_ok", lambda url: calls.append(url) or url)
+
+    assert http.fetch_hedged("https://example.com/a", "https://example.com/a.amp") == "https://example.com/a"
+    assert calls == ["https://example.com/a"]
+
+
+def test_fetch_hedged_races_hedge_url_when_primary_is_slow(monkeypatch):
+    _record("example.com", *[0.01] * HEDGE_MIN_SAMPLES)
+    monkeypatch.setattr(latency, "HEDGE_MIN_DELAY_SEC", 0.05)
+    release = threading.Event()
+
+    def fake_fetch(url):
+        if url.endswith("/a"):
+            release.wait(5)
+        return url
+
+    monkeypatch.setattr(http, "_fetch_ok", fake_fetch)
+    start = time.monotonic()
+    try:
+        assert http.fetch_hedged("https://example.com/a", "https://example.com/a.amp") == "https://example.com/a.amp"
+    finally:
+        release.set()
+    assert time.monotonic() - start < 1
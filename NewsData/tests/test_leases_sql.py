@@ -0,0 +1,140 @@
+"""Lease SQL (migration 004) against a real Postgres.
+
+Set TEST_DATABASE_URL to a disposable database to run, e.g.
+TEST_DATABASE_URL=postgresql://postgres@localhost:5432/postgres
+"""
+
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+MIGRATION = (
+    Path(__file__).resolve().parents[2]
+    / "Client/supabase/migrations/004_create_ingest_leases.sql"
+)
+
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="TEST_DATABASE_URL not set")
+
+
+@pytest.fixture
+def connect():
+    """Apply the migration in a throwaway schema; yields a connect() bound to it."""
+    schema = f"test_leases_{uuid.uuid4().hex[:8]}"
+    with psycopg.connect(DATABASE_URL, autocommit=True) as admin:
+        admin.execute(f"CREATE SCHEMA {schema}")
+        admin.execute(f"SET search_path TO {schema}")
+        admin.execute(MIGRATION.read_text())
+
+    def _connect(**kwargs):
+        return psycopg.connect(DATABASE_URL, options=f"-c search_path={schema}", **kwargs)
+
+    yield _connect
+
+    with psycopg.connect(DATABASE_URL, autocommit=True) as admin:
+        admin.execute(f"DROP SCHEMA {schema} CASCADE")
+
+
+def _seed(conn, *keys, kind="article"):
+    for key in keys:
+        conn.execute("INSERT INTO ingest_leases (kind, key) VALUES (%s, %s)", (kind, key))
+
+
+def _claim(conn, worker, limit, kind="article", lease_seconds=300, max_attempts=3, refresh=None):
+    rows = conn.execute(
+        "SELECT key FROM claim_ingest_leases(%s, %s, %s, %s, %s, %s)",
+        (kind, worker, limit, lease_seconds, max_attempts, refresh),
+    ).fetchall()
+    return sorted(row[0] for row in rows)
+
+
+def _scalar(conn, sql, params=()):
+    return conn.execute(sql, params).fetchone()[0]
+
+
+def test_claims_partition_work(connect):
+    with connect(autocommit=True) as conn:
+        _seed(conn, "a", "b", "c")
+        first = _claim(conn, "w1", 2)
+        second = _claim(conn, "w2", 2)
+        assert len(first) == 2
+        assert second == sorted({"a", "b", "c"} - set(first))
+        assert _claim(conn, "w3", 5) == []
+
+
+def test_skip_locked_does_not_block_or_duplicate(connect):
+    with connect(autocommit=True) as conn:
+        _seed(conn, "a", "b", "c")
+
+    with connect() as holder, connect(autocommit=True) as other:
+        held = _claim(holder, "w1", 1)  # transaction left open, so the row stays locked
+        other.execute("SET lock_timeout = '2s'")
+        claimed = _claim(other, "w2", 5)
+        assert len(held) == 1
+        assert claimed == sorted({"a", "b", "c"} - set(held))
+        holder.rollback()
+
+
+def test_expired_lease_is_reclaimed_until_max_attempts(connect):
+    with connect(autocommit=True) as conn:
+        _seed(conn, "a")
+        assert _claim(conn, "w1", 1, max_attempts=2) == ["a"]
+        assert _claim(conn, "w2", 1, max_attempts=2) == []
+
+        conn.execute("UPDATE ingest_leases SET lease_expires_at = NOW() - INTERVAL '1 second'")
+        assert _claim(conn, "w2", 1, max_attempts=2) == ["a"]
+        assert _scalar(conn, "SELECT worker_id FROM ingest_leases") == "w2"
+
+        conn.execute("UPDATE ingest_leases SET lease_expires_at = NOW() - INTERVAL '1 second'")
+        assert _claim(conn, "w3", 1, max_attempts=2) == []
+
+
+def test_heartbeat_extends_only_own_leases(connect):
+    with connect(autocommit=True) as conn:
+        _seed(conn, "a")
+        _claim(conn, "w1", 1, lease_seconds=1)
+        sql = "SELECT heartbeat_ingest_leases('article', %s, ARRAY['a'], 300)"
+        assert _scalar(conn, sql, ("w2",)) == 0
+        assert _scalar(conn, sql, ("w1",)) == 1
+        assert _scalar(
+            conn, "SELECT lease_expires_at - NOW() > INTERVAL '200 seconds' FROM ingest_leases"
+        )
+
+
+def test_complete_ignores_other_workers(connect):
+    with connect(autocommit=True) as conn:
+        _seed(conn, "a")
+        _claim(conn, "w1", 1)
+        assert _scalar(conn, "SELECT complete_ingest_leases('article', 'w2', ARRAY['a'])") == 0
+        assert _scalar(conn, "SELECT status FROM ingest_leases") == "leased"
+        assert _scalar(conn, "SELECT complete_ingest_leases('article', 'w1', ARRAY['a'])") == 1
+        assert _scalar(conn, "SELECT status FROM ingest_leases") == "done"
+
+
+def test_completed_feed_waits_for_refresh(connect):
+    feed = "https://example.com/rss"
+    with connect(autocommit=True) as conn:
+        _seed(conn, feed, kind="feed")
+        assert _claim(conn, "w1", 1, kind="feed", refresh=1800) == [feed]
+        assert _scalar(conn, "SELECT complete_ingest_leases('feed', 'w1', %s)", ([feed],)) == 1
+        assert _claim(conn, "w2", 1, kind="feed", refresh=1800) == []
+
+        conn.execute("UPDATE ingest_leases SET updated_at = NOW() - INTERVAL '1 hour'")
+        assert _claim(conn, "w2", 1, kind="feed", refresh=1800) == [feed]
+
+
+def test_released_lease_is_retried_until_max_attempts(connect):
+    with connect(autocommit=True) as conn:
+        _seed(conn, "a")
+        release = "SELECT release_ingest_leases('article', %s, ARRAY['a'])"
+        for attempt in range(1, 3):
+            assert _claim(conn, "w1", 1, max_attempts=2) == ["a"]
+            assert _scalar(conn, release, ("w2",)) == 0
+            assert _scalar(conn, release, ("w1",)) == 1
+            assert _scalar(conn, "SELECT status FROM ingest_leases") == "pending"
+            assert _scalar(conn, "SELECT attempts FROM ingest_leases") == attempt
+        assert _claim(conn, "w1", 1, max_attempts=2) == []
@@ -0,0 +1,144 @@
+"""Streaming <head> metadata extraction."""
+
+import json
+
+import pytest
+
+from extractors import metadata
+from extractors.metadata import extract_head_metadata
+
+URL = "https://example.com/news/story"
+
+
+class FakeResponse:
+    """Streams fixed chunks and records how many were read."""
+
+    def __init__(self, chunks, status_ok=True):
+        self.chunks = chunks
+        self.read = 0
+        self.closed = False
+        self.status_ok = status_ok
+
+    def raise_for_status(self):
+        if not self.status_ok:
+            raise RuntimeError("404")
+
+    def iter_content(self, chunk_size):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    def _serve(*chunks, **kwargs):
+        response = FakeResponse([c.encode() for c in chunks], **kwargs)
+        monkeypatch.setattr(metadata, "fetch_url", lambda url, **kw: response)
+        return response
+
+    return _serve
+
+
+def _ld(data) -> str:
+    return f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+
+def test_stops_at_end_of_head_without_reading_body(serve):
+    response = serve(
+        '<html><head><meta property="og:title" content="Rates rise">',
+        '<meta property="og:image" content="https://cdn.example.com/a.jpg"></head>',
+        "<body><p>body</p>",
+        "<p>more body</p></body></html>",
+    )
+    meta = extract_head_metadata(URL)
+
+    assert meta.title == "Rates rise"
+    assert meta.images == ["https://cdn.example.com/a.jpg"]
+    assert response.read == 2
+    assert response.closed
+
+
+def test_stops_at_body_start_when_head_is_not_closed(serve):
+    response = serve("<html><title>Plain title</title><body>", "<p>never read</p>")
+    meta = extract_head_metadata(URL)
+
+    assert meta.title == "Plain title"
+    assert response.read == 1
+
+
+def test_caps_reading_at_head_max_bytes(serve, monkeypatch):
+    monkeypatch.setattr(metadata, "HEAD_MAX_BYTES", 20)
+    response = serve(
+        "<html><head>" + "<!-- padding -->" * 2,
+        '<meta property="og:title" content="Too late">',
+        "</head>",
+    )
+    meta = extract_head_metadata(URL)
+
+    assert response.read == 1
+    assert meta.title is None
+
+
+@pytest.mark.parametrize(
+    "ld, expected",
+    [
+        ({"headline": "H", "image": "https://cdn.example.com/str.jpg"}, "https://cdn.example.com/str.jpg"),
+        ({"headline": "H", "image": ["/list.jpg", "/other.jpg"]}, "https://example.com/list.jpg"),
+        ({"headline": "H", "image": {"url": "dict.jpg"}}, "https://example.com/news/dict.jpg"),
+        (
+            {"@graph": [{"@type": "WebSite"}, {"headline": "H", "image": "/graph.jpg"}]},
+            "https://example.com/graph.jpg",
+        ),
+        ([{"@type": "Organization"}, {"headline": "H", "image": "/top.jpg"}], "https://example.com/top.jpg"),
+    ],
+)
+def test_json_ld_image_shapes(serve, ld, expected):
+    serve(f"<html><head>{_ld(ld)}</head><body></body></html>")
+    meta = extract_head_metadata(URL)
+
+    assert meta.images == [expected]
+    assert meta.title == "H"
+
+
+def test_meta_images_come_before_json_ld(serve):
+    serve(
+        '<html><head><meta name="twitter:image" content="/tw.jpg">'
+        + _ld({"headline": "H", "datePublished": "2026-01-02", "image": "/ld.jpg"})
+        + '<meta property="og:image" content="/og.jpg"></head></html>'
+    )
+    meta = extract_head_metadata(URL)
+
+    assert meta.images == [
+        "https://example.com/og.jpg",
+        "https://example.com/tw.jpg",
+        "https://example.com/ld.jpg",
+    ]
+    assert meta.published_time == "2026-01-02"
+
+
+def test_resolves_relative_canonical_and_amphtml(serve):
+    serve(
+        '<html><head><link rel="canonical" href="/news/story">'
+        '<link rel="amphtml" href="amp/story"></head></html>'
+    )
+    meta = extract_head_metadata(URL)
+
+    assert meta.canonical_url == "https://example.com/news/story"
+    assert meta.amphtml_url == "https://example.com/news/amp/story"
+
+
+def test_page_without_head_returns_empty_metadata(serve):
+    serve("<p>Just a fragment</p>")
+    meta = extract_head_metadata(URL)
+
+    assert meta.images == []
+    assert meta.title is None
+    assert meta.amphtml_url is None
+
+
+def test_http_error_returns_none(serve):
+    serve("<html></html>", status_ok=False)
+    assert extract_head_metadata(URL) is None
@@ -0,0 +1,65 @@
+"""Pool-side HTML parsing helpers."""
+
+from extractors.parsing import parse_article, parse_image_candidates
+from utils import process_pool
+from utils.html import strip_tags
+
+PAGE = b"""<html><head>
+<meta property="og:image" content="/images/lead.jpg">
+<meta property="og:image" content="/images/second.jpg">
+<meta name="twitter:image" content="https://cdn.example.com/twitter.jpg">
+<title>Central bank raises rates</title>
+</head><body>
+<nav><img src="/logo.png"></nav>
+<article>
+  <h1>Central bank raises rates</h1>
+  <img src="body-1.jpg">
+  <img data-src="lazy.jpg" src="">
+  <p>The central bank raised interest rates by half a point on Tuesday, citing inflation.</p>
+</article>
+</body></html>"""
+
+
+def test_image_candidates_meta_first_then_article_body():
+    candidates = parse_image_candidates("https://example.com/news/story", PAGE)
+    assert candidates == [
+        "https://example.com/images/lead.jpg",
+        "https://cdn.example.com/twitter.jpg",
+        "https://example.com/news/body-1.jpg",
+        "https://example.com/news/lazy.jpg",
+    ]
+
+
+def test_image_candidates_without_body_match_or_markup():
+    assert parse_image_candidates("https://example.com/a", b"<html><body><img src='x.jpg'></body></html>") == []
+    assert parse_image_candidates("https://example.com/a", b"") == []
+
+
+def test_parse_article_returns_image_candidates_from_same_pass():
+    parsed = parse_article("https://example.com/news/story", PAGE)
+    assert parsed.title == "Central bank raises rates"
+    assert parsed.image_candidates[0] == "https://example.com/images/lead.jpg"
+
+
+def test_strip_tags_removes_markup_and_collapses_whitespace():
+    assert strip_tags("<p>Rates <b>rise</b>\n\n again</p>") == "Rates rise again"
+    assert strip_tags("plain   text") == "plain text"
+    assert strip_tags("") == ""
+    assert strip_tags(None) == ""
+
+
+def test_pool_falls_back_to_spawn_without_forkserver(monkeypatch):
+    monkeypatch.setattr(process_pool.multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    assert process_pool._start_method() == "spawn"
+
+
+def test_run_cpu_runs_inline_when_pool_cannot_start(monkeypatch):
+    def broken(**kwargs):
+        raise ValueError("cannot find context for 'forkserver'")
+
+    monkeypatch.setattr(process_pool, "PARSE_WORKERS", 2)
+    monkeypatch.setattr(process_pool, "_pool", None)
+    monkeypatch.setattr(process_pool, "_pool_disabled", False)
+    monkeypatch.setattr(process_pool, "ProcessPoolExecutor", broken)
+    assert process_pool.run_cpu(strip_tags, "<b>inline</b>") == "inline"
+    assert process_pool._pool_disabled
@@ -0,0 +1,69 @@
+"""Adaptive feed polling schedule."""
+
+from config.settings import FEED_POLL_INITIAL_SEC, FEED_POLL_MAX_SEC, FEED_POLL_MIN_SEC
+from fetchers.rss_fetcher import RSSArticle
+from fetchers.scheduler import FeedSchedule, _next_interval, build_schedules
+
+
+def _articles(start: int, count: int) -> list[RSSArticle]:
+    return [
+        RSSArticle(
+            title=f"Story number {i}",
+            link=f"https://example.com/{i}",
+            snippet="",
+            published_date=None,
+            source="Example",
+            category="AI",
+            guid=f"guid-{i}",
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def _schedule() -> FeedSchedule:
+    return FeedSchedule(source="Example", url="https://example.com/rss", category="AI")
+
+
+def test_first_poll_returns_everything_and_keeps_interval():
+    schedule = _schedule()
+    new = schedule.record_poll(_articles(0, 10), now=100.0)
+    assert len(new) == 10
+    assert schedule.interval == FEED_POLL_INITIAL_SEC
+    assert schedule.next_poll > 100.0
+
+
+def test_repeat_poll_returns_only_unseen_and_backs_off():
+    schedule = _schedule()
+    schedule.record_poll(_articles(0, 10), now=0.0)
+    new = schedule.record_poll(_articles(1, 10), now=0.0)
+    assert [a.guid for a in new] == ["guid-10"]
+    assert schedule.interval == FEED_POLL_INITIAL_SEC
+
+    assert schedule.record_poll(_articles(1, 10), now=0.0) == []
+    assert schedule.interval == FEED_POLL_INITIAL_SEC * 1.5
+
+
+def test_busy_feed_speeds_up():
+    schedule = _schedule()
+    schedule.record_poll(_articles(0, 10), now=0.0)
+    schedule.record_poll(_articles(10, 10), now=0.0)
+    assert schedule.interval == FEED_POLL_INITIAL_SEC * 0.5
+
+
+def test_next_poll_has_bounded_jitter():
+    schedule = _schedule()
+    schedule.record_poll(_articles(0, 1), now=1000.0)
+    assert 1000.0 + FEED_POLL_INITIAL_SEC * 0.9 <= schedule.next_poll <= 1000.0 + FEED_POLL_INITIAL_SEC * 1.1
+
+
+def test_next_interval_is_clamped():
+    assert _next_interval(FEED_POLL_MAX_SEC, 0) == FEED_POLL_MAX_SEC
+    assert _next_interval(FEED_POLL_MIN_SEC, 10) == FEED_POLL_MIN_SEC
+    assert _next_interval(600, 1) == 600
+    assert _next_interval(600, 3) == 480
+
+
+def test_build_schedules_covers_every_feed():
+    schedules = build_schedules()
+    assert len({s.url for s in schedules}) == len(schedules)
+    assert all(s.next_poll == 0.0 for s in schedules)
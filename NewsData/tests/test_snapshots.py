@@ -0,0 +1,102 @@
+"""Feed snapshot publishing."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from config.sources import RSS_FEEDS
+from storage import snapshots
+
+
+class FakeQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        return SimpleNamespace(data=self.rows)
+
+
+class FakeBucket:
+    def __init__(self):
+        self.files = {}
+
+    def download(self, path):
+        return self.files[path]
+
+    def upload(self, path, body, options):
+        self.files[path] = body
+
+
+@pytest.fixture
+def publish(monkeypatch):
+    bucket = FakeBucket()
+
+    def _publish(rows):
+        client = SimpleNamespace(
+            table=lambda name: FakeQuery(rows),
+            storage=SimpleNamespace(from_=lambda name: bucket),
+        )
+        monkeypatch.setattr(snapshots, "get_client", lambda: client)
+        uploaded = snapshots.publish_snapshots()
+        return uploaded, {path: json.loads(body) for path, body in bucket.files.items()}
+
+    return _publish
+
+
+def _row(id, category, **kwargs):
+    row = {
+        "id": id,
+        "category": category,
+        "title": f"Title {id}",
+        "summary": "Summary",
+        "image_url": "https://example.com/a.jpg",
+        "source": "Example",
+        "published_at": "2026-01-01T00:00:00",
+        "article_url": f"https://example.com/{id}",
+        "raw": {},
+        "created_at": "2026-01-01T00:00:00",
+        "expired_at": "2026-01-03T00:00:00",
+    }
+    row.update(kwargs)
+    return row
+
+
+def test_uncategorized_rows_do_not_overwrite_grouped_snapshot(publish):
+    category = next(iter(RSS_FEEDS))
+    _, files = publish([_row("1", category), _row("2", None)])
+
+    grouped = files["news/all.json"]
+    assert isinstance(grouped, dict)
+    assert [a["id"] for a in grouped[category]] == ["1"]
+    assert [a["id"] for a in grouped["All"]] == ["2"]
+    assert [a["id"] for a in files[f"news/{category.lower()}.json"]] == ["1"]
+
+
+def test_entries_carry_expiry_and_optional_thumbnail(publish):
+    category = next(iter(RSS_FEEDS))
+    _, files = publish([
+        _row("1", category, thumbnails={"640": "https://cdn.example.com/1-640.webp"}),
+        _row("2", category, expired_at=None),
+    ])
+
+    first, second = files["news/all.json"][category]
+    assert first["imageUrl"] == "https://example.com/a.jpg"
+    assert first["thumbnailUrl"] == "https://cdn.example.com/1-640.webp"
+    assert first["expired_at"] == "2026-01-03T00:00:00"
+    assert "thumbnailUrl" not in second
+    assert files["sitemap/articles.json"][1] == {
+        "id": "2", "title": "Title 2", "date": "2026-01-01T00:00:00", "expired_at": None,
+    }
+
+
+def test_unchanged_files_are_not_reuploaded(publish):
+    rows = [_row("1", next(iter(RSS_FEEDS)))]
+    first, _ = publish(rows)
+    second, files = publish(rows)
+
+    assert first == len(files) - 1  # everything but the manifest
+    assert second == 0
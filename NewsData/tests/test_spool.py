@@ -0,0 +1,143 @@
+"""Local write-ahead spool."""
+
+import sqlite3
+
+import pytest
+
+from storage import spool
+from storage.writer import ArticleData
+
+
+@pytest.fixture(autouse=True)
+def spool_path(tmp_path, monkeypatch):
+    path = tmp_path / "spool.sqlite3"
+    monkeypatch.setattr(spool, "SPOOL_PATH", str(path))
+    return path
+
+
+@pytest.fixture
+def inserts(monkeypatch):
+    """Record inserts; set `fail` to fingerprints that should fail, `bulk_ok` to fail bulk inserts."""
+    state = {"single": [], "bulk": [], "fail": set(), "bulk_ok": True}
+
+    def insert_article(article):
+        state["single"].append(article)
+        return article.story_fingerprint not in state["fail"]
+
+    def insert_articles(articles):
+        state["bulk"].append(articles)
+        return state["bulk_ok"]
+
+    monkeypatch.setattr(spool, "insert_article", insert_article)
+    monkeypatch.setattr(spool, "insert_articles", insert_articles)
+    return state
+
+
+def _article(fingerprint, **kwargs) -> ArticleData:
+    fields = dict(
+        category="World",
+        title=f"Title {fingerprint}",
+        summary="Summary",
+        image_url="https://example.com/image.jpg",
+        source="Example",
+        published_at="2026-01-01T00:00:00",
+        article_url=f"https://example.com/{fingerprint}",
+        original_content="Body",
+        story_fingerprint=fingerprint,
+    )
+    fields.update(kwargs)
+    return ArticleData(**fields)
+
+
+def _rows():
+    with spool._connect() as conn:
+        return dict(conn.execute("SELECT fingerprint, committed FROM spool").fetchall())
+
+
+def _age_rows(seconds):
+    with spool._connect() as conn:
+        conn.execute("UPDATE spool SET created_at = datetime('now', ?)", (f"-{seconds} seconds",))
+
+
+def test_failed_insert_stays_uncommitted(inserts):
+    inserts["fail"].add("b")
+    assert spool.store_article(_article("a"))
+    assert not spool.store_article(_article("b"))
+    assert _rows() == {"a": 1, "b": 0}
+
+
+def test_spool_errors_do_not_block_insert(inserts, monkeypatch):
+    def broken(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(spool, "spool_article", broken)
+    monkeypatch.setattr(spool, "mark_committed", broken)
+    assert spool.store_article(_article("a"))
+    assert [a.story_fingerprint for a in inserts["single"]] == ["a"]
+
+
+def test_replay_bulk_inserts_and_clears_committed(inserts):
+    inserts["fail"].update({"a", "b"})
+    spool.store_article(_article("a"))
+    spool.store_article(_article("b"))
+    spool.store_article(_article("c"))
+    inserts["single"].clear()
+    inserts["fail"].clear()
+
+    assert spool.replay_spool() == (2, 0)
+    assert [sorted(a.story_fingerprint for a in batch) for batch in inserts["bulk"]] == [["a", "b"]]
+    assert inserts["single"] == []
+    assert spool.replay_spool() == (0, 0)
+    assert _rows() == {}
+
+
+def test_replay_falls_back_to_single_inserts(inserts):
+    inserts["fail"].update({"a", "b"})
+    spool.store_article(_article("a"))
+    spool.store_article(_article("b"))
+    inserts["single"].clear()
+    inserts["fail"] = {"b"}
+    inserts["bulk_ok"] = False
+
+    assert spool.replay_spool() == (1, 0)
+    assert sorted(a.story_fingerprint for a in inserts["single"]) == ["a", "b"]
+    assert _rows() == {"a": 1, "b": 0}
+
+
+def test_min_age_skips_fresh_rows(inserts):
+    inserts["fail"].add("a")
+    spool.store_article(_article("a"))
+    inserts["fail"].clear()
+
+    assert spool.replay_spool(min_age_sec=600) == (0, 0)
+    assert inserts["bulk"] == []
+
+    _age_rows(601)
+    assert spool.replay_spool(min_age_sec=600) == (1, 0)
+
+
+def test_drops_rows_after_max_attempts(inserts, monkeypatch):
+    monkeypatch.setattr(spool, "SPOOL_MAX_ATTEMPTS", 2)
+    inserts["fail"].add("a")
+    inserts["bulk_ok"] = False
+    spool.store_article(_article("a"))
+
+    assert spool.replay_spool() == (0, 0)
+    assert _rows() == {"a": 0}
+    assert spool.replay_spool() == (0, 1)
+    assert _rows() == {}
+
+
+def test_fields_round_trip(inserts):
+    original = _article(
+        "a",
+        published_at=None,
+        snippet="Snippet",
+        thumbnails={"320": "https://cdn.example.com/a-320.webp", "640": "https://cdn.example.com/a-640.webp"},
+    )
+    inserts["fail"].add("a")
+    spool.store_article(original)
+    inserts["fail"].clear()
+
+    spool.replay_spool()
+    assert inserts["bulk"] == [[original]]
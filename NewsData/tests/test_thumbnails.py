@@ -0,0 +1,100 @@
+"""WebP thumbnail rendering and storage."""
+
+import io
+
+import pytest
+from PIL import Image
+
+from processors import thumbnails
+
+
+def _image_bytes(width, height, mode="RGB", fmt="PNG") -> bytes:
+    out = io.BytesIO()
+    Image.new(mode, (width, height)).save(out, fmt)
+    return out.getvalue()
+
+
+def _size(body: bytes) -> tuple[int, int]:
+    with Image.open(io.BytesIO(body)) as image:
+        assert image.format == "WEBP"
+        return image.size
+
+
+def test_render_never_upscales_past_source_width():
+    rendered = thumbnails.render_thumbnails(_image_bytes(800, 400), [320, 640, 960])
+
+    assert _size(rendered[320]) == (320, 160)
+    assert _size(rendered[640]) == (640, 320)
+    assert _size(rendered[960]) == (800, 400)
+
+
+@pytest.mark.parametrize("mode", ["RGBA", "P", "LA", "L"])
+def test_render_handles_image_modes(mode):
+    rendered = thumbnails.render_thumbnails(_image_bytes(400, 200, mode=mode), [320])
+    assert _size(rendered[320]) == (320, 160)
+
+
+@pytest.fixture
+def local_store(tmp_path, monkeypatch):
+    """Store thumbnails in a tmp dir and parse inline; returns the download log."""
+    downloads = []
+    images = {
+        "https://example.com/a.png": _image_bytes(1000, 500),
+        "https://mirror.example.com/a-copy.png": _image_bytes(1000, 500),
+        "https://example.com/b.png": _image_bytes(500, 500),
+    }
+
+    def download(url):
+        downloads.append(url)
+        return images.get(url)
+
+    monkeypatch.setattr(thumbnails, "THUMBNAIL_DIR", str(tmp_path))
+    monkeypatch.setattr(thumbnails, "THUMBNAIL_BASE_URL", "https://cdn.example.com/thumbs/")
+    monkeypatch.setattr(thumbnails, "_stored", {})
+    monkeypatch.setattr(thumbnails, "_download", download)
+    monkeypatch.setattr(thumbnails, "run_cpu", lambda fn, *args: fn(*args))
+    return downloads
+
+
+def test_create_writes_variants_to_thumbnail_dir(local_store, tmp_path):
+    urls = thumbnails.create_thumbnails("https://example.com/a.png")
+
+    assert set(urls) == {"320", "640", "960"}
+    for width, url in urls.items():
+        assert url.startswith("https://cdn.example.com/thumbs/")
+        path = tmp_path / url.removeprefix("https://cdn.example.com/thumbs/")
+        assert path.name.endswith(f"-{width}.webp")
+        assert _size(path.read_bytes())[0] == int(width)
+
+
+def test_same_content_is_encoded_once(local_store, tmp_path, monkeypatch):
+    first = thumbnails.create_thumbnails("https://example.com/a.png")
+
+    renders = []
+    monkeypatch.setattr(thumbnails, "run_cpu", lambda fn, *args: renders.append(args) or fn(*args))
+    assert thumbnails.create_thumbnails("https://mirror.example.com/a-copy.png") == first
+
+    # Evicted from the in-memory cache, the files on disk still prevent re-encoding
+    monkeypatch.setattr(thumbnails, "_stored", {})
+    assert thumbnails.create_thumbnails("https://example.com/a.png") == first
+    assert renders == []
+    assert len(list(tmp_path.rglob("*.webp"))) == 3
+
+
+def test_stored_cache_is_bounded(local_store, monkeypatch):
+    monkeypatch.setattr(thumbnails, "MAX_STORED_DIGESTS", 1)
+    thumbnails.create_thumbnails("https://example.com/a.png")
+    thumbnails.create_thumbnails("https://example.com/b.png")
+    assert len(thumbnails._stored) == 1
+
+
+def test_skips_placeholders_and_failed_downloads(local_store):
+    assert thumbnails.create_thumbnails(thumbnails.FALLBACK_PLACEHOLDER_IMAGE) is None
+    assert thumbnails.create_thumbnails("https://example.com/missing.png") is None
+    assert local_store == ["https://example.com/missing.png"]
+
+
+def test_local_dir_without_base_url_records_nothing(local_store, monkeypatch):
+    monkeypatch.setattr(thumbnails, "THUMBNAIL_BASE_URL", "")
+    assert thumbnails.create_thumbnails("https://example.com/a.png") is None
+    assert local_store == []
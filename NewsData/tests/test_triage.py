@@ -0,0 +1,73 @@
+"""Pre-extraction triage of RSS entries."""
+
+from datetime import datetime, timedelta, timezone
+
+from config.settings import ARTICLE_EXPIRE_HOURS
+from fetchers.rss_fetcher import RSSArticle
+from processors.triage import triage
+
+
+def _article(title, link="https://example.com/news/story", snippet="", hours_ago=1.0):
+    published = None
+    if hours_ago is not None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        published = (now - timedelta(hours=hours_ago)).isoformat()
+    return RSSArticle(
+        title=title,
+        link=link,
+        snippet=snippet,
+        published_date=published,
+        source="Example",
+        category="World",
+    )
+
+
+def test_keeps_regular_articles_newest_first():
+    older = _article("Parliament passes budget", link="https://example.com/a", hours_ago=5)
+    newer = _article("Storm hits the coast", link="https://example.com/b", hours_ago=1)
+    undated = _article("Markets close higher", link="https://example.com/c", hours_ago=None)
+
+    kept, rejected = triage([older, undated, newer])
+
+    assert kept == [newer, older, undated]
+    assert not rejected
+
+
+def test_rejects_media_urls_including_publisher_specific_patterns():
+    kept, rejected = triage([
+        _article("Flood footage", link="https://example.com/video/flood"),
+        _article("Election results", link="https://www.bbc.co.uk/news/av/world-123"),
+        _article("Election results explained", link="https://www.example.com/av/world-123"),
+    ])
+
+    assert [a.link for a in kept] == ["https://www.example.com/av/world-123"]
+    assert rejected == {"media_url": 2}
+
+
+def test_rejects_media_titles_case_insensitively():
+    kept, rejected = triage([_article("LIVE: Election night updates"), _article("Watch: the launch")])
+    assert kept == []
+    assert rejected == {"media_title": 2}
+
+
+def test_rejects_stale_entries_and_ignores_bad_dates():
+    stale = _article("Old news", link="https://example.com/old", hours_ago=ARTICLE_EXPIRE_HOURS + 1)
+    bad_date = _article("Odd feed", link="https://example.com/odd")
+    bad_date.published_date = "not a date"
+
+    kept, rejected = triage([stale, bad_date])
+
+    assert kept == [bad_date]
+    assert rejected == {"stale": 1}
+
+
+def test_rejects_near_duplicates_but_keeps_distinct_stories():
+    title = "Central bank raises interest rates by half a point"
+    first = _article(title, link="https://example.com/1", hours_ago=1)
+    syndicated = _article(title, link="https://example.org/2", hours_ago=2)
+    different = _article("Central bank holds interest rates steady", link="https://example.com/3", hours_ago=3)
+
+    kept, rejected = triage([first, syndicated, different])
+
+    assert kept == [first, different]
+    assert rejected == {"near_duplicate": 1}
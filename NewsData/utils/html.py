@@ -0,0 +1,17 @@
+"""HTML text utilities."""
+
+import re
+
+import lxml.html
+from lxml.etree import ParserError
+
+
+def strip_tags(html: str) -> str:
+    """Strip markup from an HTML fragment and collapse whitespace."""
+    if not html:
+        return ""
+    try:
+        text = lxml.html.fragment_fromstring(html, create_parent="div").text_content()
+    except (ParserError, ValueError):
+        text = re.sub(r"<[^>]+>", "", html)
+    return re.sub(r"\s+", " ", text).strip()
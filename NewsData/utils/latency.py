@@ -0,0 +1,63 @@
+"""Per-domain response time tracking for adaptive timeouts and hedging."""
+
+import threading
+from collections import deque
+
+from config.settings import (
+    CONNECT_TIMEOUT,
+    HEDGE_MIN_DELAY_SEC,
+    HEDGE_MIN_SAMPLES,
+    LATENCY_WINDOW,
+    MIN_CONNECT_TIMEOUT,
+    MIN_READ_TIMEOUT,
+    REQUEST_TIMEOUT,
+)
+
+_samples: dict[str, deque[float]] = {}
+_first_byte: dict[str, deque[float]] = {}
+_lock = threading.Lock()
+
+
+def record(domain: str, seconds: float):
+    """Record a successful response time for a domain."""
+    with _lock:
+        _samples.setdefault(domain, deque(maxlen=LATENCY_WINDOW)).append(seconds)
+
+
+def record_first_byte(domain: str, seconds: float):
+    """Record time until response headers arrived (connect + server wait) for a domain."""
+    with _lock:
+        _first_byte.setdefault(domain, deque(maxlen=LATENCY_WINDOW)).append(seconds)
+
+
+def percentile(domain: str, p: float, first_byte: bool = False) -> float | None:
+    """Return the p-th percentile (0-1) of recent response times, or None if too few samples.
+
+    With `first_byte`, use time-to-headers samples instead of full response times.
+    """
+    with _lock:
+        samples = sorted((_first_byte if first_byte else _samples).get(domain, ()))
+    if len(samples) < HEDGE_MIN_SAMPLES:
+        return None
+    return samples[int(p * (len(samples) - 1))]
+
+
+def timeouts_for(domain: str) -> tuple[float, float]:
+    """(connect, read) timeouts from 2x the domain's p99s, each clamped to its min/max.
+
+    Connecting happens before the headers arrive, so the time-to-headers p99 bounds it.
+    """
+    ttfb = percentile(domain, 0.99, first_byte=True)
+    connect = CONNECT_TIMEOUT if ttfb is None else min(max(ttfb * 2, MIN_CONNECT_TIMEOUT), CONNECT_TIMEOUT)
+    p99 = percentile(domain, 0.99)
+    if p99 is None:
+        return connect, REQUEST_TIMEOUT
+    return connect, min(max(p99 * 2, MIN_READ_TIMEOUT), REQUEST_TIMEOUT)
+
+
+def hedge_delay(domain: str) -> float | None:
+    """How long to wait before hedging: the domain's p95, or None (don't hedge) until it is known."""
+    p95 = percentile(domain, 0.95)
+    if p95 is None:
+        return None
+    return max(p95, HEDGE_MIN_DELAY_SEC)
@@ -0,0 +1,62 @@
+"""Process pool for CPU-bound parsing work."""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from config.settings import PARSE_WORKERS
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+_pool_disabled = False
+
+
+def _start_method() -> str:
+    # The pool is created from fetch threads; forking a threaded process can deadlock.
+    # forkserver is unavailable on Windows, where spawn is the only option.
+    methods = multiprocessing.get_all_start_methods()
+    return "forkserver" if "forkserver" in methods else "spawn"
+
+
+def get_pool() -> ProcessPoolExecutor | None:
+    """Get or create the shared process pool; None if it cannot be created."""
+    global _pool, _pool_disabled
+    with _pool_lock:
+        if _pool is None and not _pool_disabled:
+            try:
+                _pool = ProcessPoolExecutor(
+                    max_workers=PARSE_WORKERS,
+                    mp_context=multiprocessing.get_context(_start_method()),
+                )
+            except (OSError, ValueError) as e:
+                print(f"  Process pool unavailable, parsing inline: {e}")
+                _pool_disabled = True
+        return _pool
+
+
+def run_cpu(fn, *args):
+    """Run fn(*args) in the process pool, falling back to inline on pool failure."""
+    global _pool
+    if PARSE_WORKERS <= 1:
+        return fn(*args)
+    pool = get_pool()
+    if pool is None:
+        return fn(*args)
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        with _pool_lock:
+            _pool = None
+        return fn(*args)
+
+
+def shutdown_pool():
+    """Shut down the shared process pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None